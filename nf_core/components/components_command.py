@@ -9,7 +9,7 @@ import yaml
 from nf_core.modules.modules_json import ModulesJson
 from nf_core.modules.modules_repo import ModulesRepo
 
-from .components_utils import get_repo_info
+from .components_utils import find_component_dirs, get_repo_info
 
 log = logging.getLogger(__name__)
 
@@ -70,11 +70,7 @@ class ComponentCommand:
             component_base_path = Path(self.dir, self.default_modules_path)
         elif self.component_type == "subworkflows":
             component_base_path = Path(self.dir, self.default_subworkflows_path)
-        return [
-            str(Path(dir).relative_to(component_base_path))
-            for dir, _, files in os.walk(component_base_path)
-            if "main.nf" in files
-        ]
+        return find_component_dirs(component_base_path)
 
     def has_valid_directory(self):
         """Check that we were given a pipeline or clone of nf-core/modules"""
@@ -140,9 +136,7 @@ class ComponentCommand:
         if not repo_dir.exists():
             raise LookupError(f"Nothing installed from {install_dir} in pipeline")
 
-        return [
-            str(Path(dir_path).relative_to(repo_dir)) for dir_path, _, files in os.walk(repo_dir) if "main.nf" in files
-        ]
+        return find_component_dirs(repo_dir)
 
     def install_component_files(self, component_name, component_version, modules_repo, install_dir):
         """
@@ -191,13 +185,12 @@ class ComponentCommand:
         """
         if self.repo_type == "pipeline":
             wrong_location_modules = []
-            for directory, _, files in os.walk(Path(self.dir, "modules")):
-                if "main.nf" in files:
-                    module_path = Path(directory).relative_to(Path(self.dir, "modules"))
-                    parts = module_path.parts
-                    # Check that there are modules installed directly under the 'modules' directory
-                    if parts[1] == "modules":
-                        wrong_location_modules.append(module_path)
+            for module_dir in find_component_dirs(Path(self.dir, "modules")):
+                module_path = Path(module_dir)
+                parts = module_path.parts
+                # Check that there are modules installed directly under the 'modules' directory
+                if parts[1] == "modules":
+                    wrong_location_modules.append(module_path)
             # If there are modules installed in the wrong location
             if len(wrong_location_modules) > 0:
                 log.info("The modules folder structure is outdated. Reinstalling modules.")
@@ -80,6 +80,34 @@ def get_repo_info(directory, use_prompt=True):
     return [base_dir, repo_type, org]
 
 
+def find_component_dirs(directory):
+    """
+    Find the module/subworkflow directories below a directory, i.e. the directories containing a 'main.nf' file.
+    Modules/subworkflows are not nested, so the directories inside of one are not searched.
+
+    Args:
+        directory (str): The directory to search
+
+    Returns:
+        [str]: The paths of the module/subworkflow directories, relative to 'directory'
+    """
+    component_dirs = []
+    stack = [str(directory)]
+    while stack:
+        dir_path = stack.pop()
+        try:
+            with os.scandir(dir_path) as scan:
+                entries = list(scan)
+        except OSError:
+            continue
+        if any(entry.name == "main.nf" and not entry.is_dir() for entry in entries):
+            component_dirs.append(os.path.relpath(dir_path, directory))
+            continue
+        # Reversed, so that directories are visited in the order they are listed
+        stack.extend(entry.path for entry in reversed(entries) if entry.is_dir(follow_symlinks=False))
+    return component_dirs
+
+
 def prompt_component_version_sha(component_name, component_type, modules_repo, installed_sha=None):
     """
     Creates an interactive questionary prompt for selecting the module/subworkflow version
@@ -3,10 +3,12 @@
 from __future__ import print_function
 
 import copy
+import functools
 import json
 import logging
 import os
 import re
+import shlex
 import subprocess
 import webbrowser
 
@@ -21,6 +23,147 @@ from nf_core.lint_utils import dump_json_with_prettier
 
 log = logging.getLogger(__name__)
 
+# Default Nextflow work directory, read from the environment once
+_NXF_WORK_DEFAULT = os.getenv("NXF_WORK") or "./work"
+
+
+def _filter_boolean(val):
+    """Convert a returned boolean answer to a bool"""
+    if isinstance(val, bool):
+        return val
+    return val.lower() == "true"
+
+
+def _filter_number(val):
+    """Convert a returned number answer to a float"""
+    if val.strip() == "":
+        return ""
+    return float(val)
+
+
+def _filter_integer(val):
+    """Convert a returned integer answer to an int"""
+    if val.strip() == "":
+        return ""
+    return int(val)
+
+
+def _validate_number(val, minimum=None, maximum=None):
+    """
+    Validate a returned number answer
+
+    The optional minimum and maximum are (limit, label) tuples: the limit
+    converted to a float and the value as written in the schema.
+    """
+    try:
+        if val.strip() == "":
+            return True
+        fval = float(val)
+        if minimum is not None and fval < minimum[0]:
+            return f"Must be greater than or equal to {minimum[1]}"
+        if maximum is not None and fval > maximum[0]:
+            return f"Must be less than or equal to {maximum[1]}"
+    except ValueError:
+        return "Must be a number"
+    else:
+        return True
+
+
+def _validate_integer(val):
+    """Validate a returned integer answer"""
+    try:
+        if val.strip() == "":
+            return True
+        if int(val) != float(val):
+            raise AssertionError(f'Expected an integer, got "{val}"')
+    except (AssertionError, ValueError):
+        return "Must be an integer"
+    else:
+        return True
+
+
+def _validate_pattern(pattern, val):
+    """Validate a returned answer against a compiled schema pattern"""
+    if val == "":
+        return True
+    if pattern.search(val) is not None:
+        return True
+    return f"Must match pattern: {pattern.pattern}"
+
+
+# Filter functions to apply to returned values, by JSON Schema param type
+_FILTERS = {
+    "boolean": _filter_boolean,
+    "number": _filter_number,
+    "integer": _filter_integer,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_markdown(text):
+    """Parse description / help text once, as group headers are reprinted on every prompt"""
+    return Markdown(text)
+
+
+def _coerce_default(param_type, default):
+    """Convert a default value to the string shown in a Questionary question"""
+    # Boolean strings are normalised so that they match the "True" / "False" choices
+    if param_type == "boolean" and isinstance(default, str):
+        default = default.lower() == "true"
+    return str(default)
+
+
+# Question asking whether to use the web-based or cli wizard
+_WEB_GUI_QUESTION = {
+    "type": "list",
+    "name": "use_web_gui",
+    "message": "Choose launch method",
+    "choices": ["Web based", "Command line"],
+    "default": "Web based",
+}
+
+
+def _param_to_question(param_id, param_obj):
+    """
+    Build the parts of a Questionary question that depend only on the schema
+
+    Args:
+      param_id: Parameter ID (string)
+      param_obj: JSON Schema keys (dict)
+
+    Returns:
+      Questionary dict without a default value
+    """
+    question = {"type": "input", "name": param_id, "message": ""}
+
+    if param_obj.get("type") == "boolean":
+        question["type"] = "list"
+        question["choices"] = ["True", "False"]
+        question["filter"] = _filter_boolean
+
+    if param_obj.get("type") == "number":
+        # Convert the range limits once, rather than on every validation call
+        minimum = (float(param_obj["minimum"]), param_obj["minimum"]) if "minimum" in param_obj else None
+        maximum = (float(param_obj["maximum"]), param_obj["maximum"]) if "maximum" in param_obj else None
+        question["validate"] = functools.partial(_validate_number, minimum=minimum, maximum=maximum)
+        question["filter"] = _filter_number
+
+    if param_obj.get("type") == "integer":
+        question["validate"] = _validate_integer
+        question["filter"] = _filter_integer
+
+    if "enum" in param_obj:
+        # Use a selection list instead of free text input
+        question["type"] = "list"
+        question["choices"] = param_obj["enum"]
+
+    # Validate pattern from schema
+    if "pattern" in param_obj:
+        # Compile once when building the question, not on every validation call
+        question["validate"] = functools.partial(_validate_pattern, re.compile(param_obj["pattern"]))
+
+    return question
+
 
 class Launch:
     """Class to hold config option to launch a pipeline"""
@@ -59,6 +202,7 @@ class Launch:
             self.web_schema_launch_web_url = f"{self.web_schema_launch_url}?id={web_id}"
             self.web_schema_launch_api_url = f"{self.web_schema_launch_url}?id={web_id}&api=true"
         self.nextflow_cmd = None
+        self.nextflow_argv = None
 
         # Fetch remote workflows
         self.wfs = nf_core.list.Workflows()
@@ -82,7 +226,7 @@ class Launch:
                     "-work-dir": {
                         "type": "string",
                         "description": "Work directory for intermediate files",
-                        "default": os.getenv("NXF_WORK") if os.getenv("NXF_WORK") else "./work",
+                        "default": _NXF_WORK_DEFAULT,
                     },
                     "-resume": {
                         "type": "boolean",
@@ -93,9 +237,16 @@ class Launch:
                 },
             }
         }
+        self.nxf_flag_names = frozenset(self.nxf_flag_schema["coreNextflow"]["properties"])
+        self.nxf_flag_defaults = {
+            param_id: param_obj.get("default")
+            for param_id, param_obj in self.nxf_flag_schema["coreNextflow"]["properties"].items()
+        }
         self.nxf_flags = {}
         self.params_user = {}
         self.cli_launch = True
+        self._param_specs = None
+        self._schema_json = None
 
     def launch_pipeline(self):
 
@@ -195,6 +346,8 @@ class Launch:
 
         # Set up the schema
         self.schema_obj = nf_core.schema.PipelineSchema()
+        self._param_specs = None
+        self._schema_json = None
 
         # Check if this is a local directory
         localpath = os.path.abspath(os.path.expanduser(self.pipeline))
@@ -202,11 +355,13 @@ class Launch:
             # Set the nextflow launch command to use full paths
             self.pipeline = localpath
             self.nextflow_cmd = f"nextflow run {localpath}"
+            self.nextflow_argv = ["nextflow", "run", localpath]
         else:
             # Assume nf-core if no org given
             if self.pipeline.count("/") == 0:
                 self.pipeline = f"nf-core/{self.pipeline}"
             self.nextflow_cmd = f"nextflow run {self.pipeline}"
+            self.nextflow_argv = ["nextflow", "run", self.pipeline]
 
             if not self.pipeline_revision:
                 try:
@@ -219,6 +374,7 @@ class Launch:
 
                 self.pipeline_revision = nf_core.utils.prompt_pipeline_release_branch(wf_releases, wf_branches)
             self.nextflow_cmd += f" -r {self.pipeline_revision}"
+            self.nextflow_argv.extend(["-r", self.pipeline_revision])
 
         # Get schema from name, load it and lint it
         try:
@@ -255,7 +411,11 @@ class Launch:
         """
         # Set the inputs to the schema defaults unless already set by --id
         if len(self.schema_obj.input_params) == 0:
-            self.schema_obj.input_params = copy.deepcopy(self.schema_obj.schema_defaults)
+            # Defaults are almost all scalars, so only deep copy the odd list / dict
+            self.schema_obj.input_params = {
+                param_id: copy.deepcopy(val) if isinstance(val, (list, dict)) else val
+                for param_id, val in self.schema_obj.schema_defaults.items()
+            }
 
         # If we have a params_file, load and validate it against the schema
         if self.params_in:
@@ -266,39 +426,67 @@ class Launch:
     def merge_nxf_flag_schema(self):
         """Take the Nextflow flag schema and merge it with the pipeline schema"""
         # Add the coreNextflow subschema to the schema definitions
-        if "definitions" not in self.schema_obj.schema:
-            self.schema_obj.schema["definitions"] = {}
-        self.schema_obj.schema["definitions"].update(self.nxf_flag_schema)
+        self.schema_obj.schema["definitions"] = {
+            **self.schema_obj.schema.get("definitions", {}),
+            **self.nxf_flag_schema,
+        }
         # Add the new defintion to the allOf key so that it's included in validation
-        # Put it at the start of the list so that it comes first
+        # Put it at the start of the list so that it comes first (only once, if merged again)
+        nxf_flag_ref = {"$ref": "#/definitions/coreNextflow"}
         if "allOf" not in self.schema_obj.schema:
             self.schema_obj.schema["allOf"] = []
-        self.schema_obj.schema["allOf"].insert(0, {"$ref": "#/definitions/coreNextflow"})
+        if nxf_flag_ref not in self.schema_obj.schema["allOf"]:
+            self.schema_obj.schema["allOf"].insert(0, nxf_flag_ref)
+        # Parameters have changed, so any compiled specs and serialised schema are stale
+        self._param_specs = None
+        self._schema_json = None
+
+    def compile_schema(self):
+        """
+        Walk the schema once and index every parameter by ID
+
+        Covers both top-level properties and those grouped in definitions, so that
+        the prompt and sanitise steps don't have to re-walk the schema for every
+        parameter. The result is cached until the schema changes.
+
+        Returns:
+          Dict of param_id: spec dict, with the JSON Schema keys (``param_obj``),
+          the ``filter`` function for the param type and the questionary
+          ``question`` skeleton (built lazily, without a default)
+        """
+        if self._param_specs is None:
+            self._param_specs = {}
+            param_objs = list(self.schema_obj.schema.get("properties", {}).items())
+            for definition in self.schema_obj.schema.get("definitions", {}).values():
+                param_objs.extend(definition.get("properties", {}).items())
+            for param_id, param_obj in param_objs:
+                self._param_specs[param_id] = {
+                    "param_obj": param_obj,
+                    "filter": _FILTERS.get(param_obj.get("type")),
+                    "question": None,
+                }
+        return self._param_specs
 
     def prompt_web_gui(self):
         """Ask whether to use the web-based or cli wizard to collect params"""
         log.info(
             "[magenta]Would you like to enter pipeline parameters using a web-based interface or a command-line wizard?"
         )
-        question = {
-            "type": "list",
-            "name": "use_web_gui",
-            "message": "Choose launch method",
-            "choices": ["Web based", "Command line"],
-            "default": "Web based",
-        }
-        answer = questionary.unsafe_prompt([question], style=nf_core.utils.nfcore_question_style)
+        answer = questionary.unsafe_prompt([_WEB_GUI_QUESTION], style=nf_core.utils.nfcore_question_style)
         return answer["use_web_gui"] == "Web based"
 
     def launch_web_gui(self):
         """Send schema to nf-core website and launch input GUI"""
 
+        # Only serialise the schema again if it has changed since the last launch
+        if self._schema_json is None:
+            self._schema_json = json.dumps(self.schema_obj.schema)
         content = {
             "post_content": "json_schema_launcher",
             "api": "true",
             "version": nf_core.__version__,
             "status": "waiting_for_user",
-            "schema": json.dumps(self.schema_obj.schema),
+            "schema": self._schema_json,
             "nxf_flags": json.dumps(self.nxf_flags),
             "input_params": json.dumps(self.schema_obj.input_params),
             "cli_launch": True,
@@ -352,8 +540,11 @@ class Launch:
                 if len(web_response["input_params"]) > 0:
                     self.schema_obj.input_params = web_response["input_params"]
                 self.schema_obj.schema = web_response["schema"]
+                self._param_specs = None
+                self._schema_json = None
                 self.cli_launch = web_response["cli_launch"]
                 self.nextflow_cmd = web_response["nextflow_cmd"]
+                self.nextflow_argv = shlex.split(self.nextflow_cmd)
                 self.pipeline = web_response["pipeline"]
                 self.pipeline_revision = web_response["revision"]
                 # Sanitise form inputs, set proper variable types etc
@@ -376,26 +567,22 @@ class Launch:
         The web builder returns everything as strings.
         Use the functions defined in the cli wizard to convert to the correct types.
         """
-        # Collect questionary objects for each defined input_param
-        questionary_objects = {}
-        for param_id, param_obj in self.schema_obj.schema.get("properties", {}).items():
-            questionary_objects[param_id] = self.single_param_to_questionary(param_id, param_obj, print_help=False)
-
-        for _, definition in self.schema_obj.schema.get("definitions", {}).items():
-            for param_id, param_obj in definition.get("properties", {}).items():
-                questionary_objects[param_id] = self.single_param_to_questionary(param_id, param_obj, print_help=False)
+        param_specs = self.compile_schema()
 
-        # Go through input params and sanitise
-        for params in [self.nxf_flags, self.schema_obj.input_params]:
-            for param_id in list(params.keys()):
+        def sanitise_params(params):
+            sanitised = {}
+            for param_id, val in params.items():
                 # Remove if an empty string
-                if str(params[param_id]).strip() == "":
-                    del params[param_id]
+                if str(val).strip() == "":
                     continue
                 # Run filter function on value
-                filter_func = questionary_objects.get(param_id, {}).get("filter")
-                if filter_func is not None:
-                    params[param_id] = filter_func(params[param_id])
+                filter_func = param_specs[param_id]["filter"] if param_id in param_specs else None
+                sanitised[param_id] = val if filter_func is None else filter_func(val)
+            return sanitised
+
+        # Go through input params and sanitise
+        self.nxf_flags = sanitise_params(self.nxf_flags)
+        self.schema_obj.input_params = sanitise_params(self.schema_obj.input_params)
 
     def prompt_schema(self):
         """Go through the pipeline schema and prompt user to change defaults"""
@@ -406,14 +593,15 @@ class Launch:
             answers.update(self.prompt_group(d_key, self.schema_obj.schema["definitions"][d_key]))
 
         # Top level schema params
+        required = self.schema_obj.schema.get("required", [])
         for param_id, param_obj in self.schema_obj.schema.get("properties", {}).items():
             if not param_obj.get("hidden", False) or self.show_hidden:
-                is_required = param_id in self.schema_obj.schema.get("required", [])
+                is_required = param_id in required
                 answers = self.prompt_param(param_id, param_obj, is_required, answers)
 
         # Split answers into core nextflow options and params
         for key, answer in answers.items():
-            if key in self.nxf_flag_schema["coreNextflow"]["properties"]:
+            if key in self.nxf_flag_names:
                 self.nxf_flags[key] = answer
             else:
                 self.params_user[key] = answer
@@ -460,6 +648,7 @@ class Launch:
         while_break = False
         answers = {}
         error_msgs = []
+        required = group_obj.get("required", [])
         while not while_break:
 
             if len(error_msgs) == 0:
@@ -493,7 +682,7 @@ class Launch:
                     elif "default" in param:
                         q_title.append(("class:choice-default", f"[{param['default']}]"))
                     # Show that it's required if not filled in and no default
-                    elif param_id in group_obj.get("required", []):
+                    elif param_id in required:
                         q_title.append(("class:choice-required", "(required)"))
                     question["choices"].append(questionary.Choice(title=q_title, value=param_id))
 
@@ -505,7 +694,7 @@ class Launch:
             if answer[group_id] == "Continue >>":
                 while_break = True
                 # Check if there are any required parameters that don't have answers
-                for p_required in group_obj.get("required", []):
+                for p_required in required:
                     req_default = self.schema_obj.input_params.get(p_required, "")
                     req_answer = answers.get(p_required, "")
                     if req_default == "" and req_answer == "":
@@ -513,7 +702,7 @@ class Launch:
                         while_break = False
             else:
                 param_id = answer[group_id]
-                is_required = param_id in group_obj.get("required", [])
+                is_required = param_id in required
                 answers = self.prompt_param(param_id, group_obj["properties"][param_id], is_required, answers)
 
         return answers
@@ -533,115 +722,35 @@ class Launch:
         if answers is None:
             answers = {}
 
-        question = {"type": "input", "name": param_id, "message": ""}
+        # Reuse the question skeleton compiled for this schema param, if we have one
+        param_spec = None
+        if self.schema_obj is not None:
+            param_spec = self.compile_schema().get(param_id)
+            if param_spec is not None and param_spec["param_obj"] is not param_obj:
+                param_spec = None
+        if param_spec is None:
+            question = _param_to_question(param_id, param_obj)
+        else:
+            if param_spec["question"] is None:
+                param_spec["question"] = _param_to_question(param_id, param_obj)
+            question = dict(param_spec["question"])
 
         # Print the name, description & help text
         if print_help:
             nice_param_id = f"--{param_id}" if not param_id.startswith("-") else param_id
             self.print_param_header(nice_param_id, param_obj)
 
-        if param_obj.get("type") == "boolean":
-            question["type"] = "list"
-            question["choices"] = ["True", "False"]
-            question["default"] = "False"
-
-        # Start with the default from the param object
-        if "default" in param_obj:
-            # Boolean default is cast back to a string later - this just normalises all inputs
-            if param_obj["type"] == "boolean" and type(param_obj["default"]) is str:
-                question["default"] = param_obj["default"].lower() == "true"
-            else:
-                question["default"] = param_obj["default"]
-
-        # Overwrite default with parsed schema, includes --params-in etc
-        if self.schema_obj is not None and param_id in self.schema_obj.input_params:
-            if param_obj["type"] == "boolean" and type(self.schema_obj.input_params[param_id]) is str:
-                question["default"] = "true" == self.schema_obj.input_params[param_id].lower()
-            else:
-                question["default"] = self.schema_obj.input_params[param_id]
-
-        # Overwrite default if already had an answer
+        # Use the default with the highest precedence: an existing answer, then the
+        # parsed schema inputs (includes --params-in etc), then the schema default
+        param_type = param_obj.get("type")
         if param_id in answers:
-            question["default"] = answers[param_id]
-
-        # Coerce default to a string
-        if "default" in question:
-            question["default"] = str(question["default"])
-
-        if param_obj.get("type") == "boolean":
-            # Filter returned value
-            def filter_boolean(val):
-                if isinstance(val, bool):
-                    return val
-                return val.lower() == "true"
-
-            question["filter"] = filter_boolean
-
-        if param_obj.get("type") == "number":
-            # Validate number type
-            def validate_number(val):
-                try:
-                    if val.strip() == "":
-                        return True
-                    fval = float(val)
-                    if "minimum" in param_obj and fval < float(param_obj["minimum"]):
-                        return f"Must be greater than or equal to {param_obj['minimum']}"
-                    if "maximum" in param_obj and fval > float(param_obj["maximum"]):
-                        return f"Must be less than or equal to {param_obj['maximum']}"
-                except ValueError:
-                    return "Must be a number"
-                else:
-                    return True
-
-            question["validate"] = validate_number
-
-            # Filter returned value
-            def filter_number(val):
-                if val.strip() == "":
-                    return ""
-                return float(val)
-
-            question["filter"] = filter_number
-
-        if param_obj.get("type") == "integer":
-            # Validate integer type
-            def validate_integer(val):
-                try:
-                    if val.strip() == "":
-                        return True
-                    if int(val) != float(val):
-                        raise AssertionError(f'Expected an integer, got "{val}"')
-                except (AssertionError, ValueError):
-                    return "Must be an integer"
-                else:
-                    return True
-
-            question["validate"] = validate_integer
-
-            # Filter returned value
-            def filter_integer(val):
-                if val.strip() == "":
-                    return ""
-                return int(val)
-
-            question["filter"] = filter_integer
-
-        if "enum" in param_obj:
-            # Use a selection list instead of free text input
-            question["type"] = "list"
-            question["choices"] = param_obj["enum"]
-
-        # Validate pattern from schema
-        if "pattern" in param_obj:
-
-            def validate_pattern(val):
-                if val == "":
-                    return True
-                if re.search(param_obj["pattern"], val) is not None:
-                    return True
-                return f"Must match pattern: {param_obj['pattern']}"
-
-            question["validate"] = validate_pattern
+            question["default"] = _coerce_default(param_type, answers[param_id])
+        elif self.schema_obj is not None and param_id in self.schema_obj.input_params:
+            question["default"] = _coerce_default(param_type, self.schema_obj.input_params[param_id])
+        elif "default" in param_obj:
+            question["default"] = _coerce_default(param_type, param_obj["default"])
+        elif param_type == "boolean":
+            question["default"] = "False"
 
         return question
 
@@ -652,10 +761,10 @@ class Launch:
         console.print("\n")
         console.print(f"[bold blue]?[/] [bold on black] {param_obj.get('title', param_id)} [/]")
         if "description" in param_obj:
-            md = Markdown(param_obj["description"])
+            md = _parse_markdown(param_obj["description"])
             console.print(md)
         if "help_text" in param_obj:
-            help_md = Markdown(param_obj["help_text"].strip())
+            help_md = _parse_markdown(param_obj["help_text"].strip())
             console.print(help_md, style="dim")
         if is_group:
             console.print("(Use arrow keys)", style="italic", highlight=False)
@@ -663,38 +772,43 @@ class Launch:
     def strip_default_params(self):
         """Strip parameters if they have not changed from the default"""
 
-        # Go through each supplied parameter (force list so we can delete in the loop)
-        for param_id in list(self.schema_obj.input_params.keys()):
-            val = self.schema_obj.input_params[param_id]
-
-            # Params with a schema default
-            if param_id in self.schema_obj.schema_defaults:
-                # Strip if param is same as the schema default
-                if val == self.schema_obj.schema_defaults[param_id]:
-                    del self.schema_obj.input_params[param_id]
+        schema_defaults = self.schema_obj.schema_defaults
 
-            # Params with no schema default
-            else:
-                # Strip if param is empty
-                if val is False or val is None or val == "":
-                    del self.schema_obj.input_params[param_id]
+        # Strip params that are the same as the schema default, or empty if they have no default
+        self.schema_obj.input_params = {
+            param_id: val
+            for param_id, val in self.schema_obj.input_params.items()
+            if (param_id in schema_defaults and val != schema_defaults[param_id])
+            or (param_id not in schema_defaults and not (val is False or val is None or val == ""))
+        }
 
         # Nextflow flag defaults
-        for param_id, val in self.nxf_flag_schema["coreNextflow"]["properties"].items():
-            if param_id in self.nxf_flags and self.nxf_flags[param_id] == val.get("default"):
-                del self.nxf_flags[param_id]
+        self.nxf_flags = {
+            param_id: val
+            for param_id, val in self.nxf_flags.items()
+            if param_id not in self.nxf_flag_defaults or val != self.nxf_flag_defaults[param_id]
+        }
 
     def build_command(self):
         """Build the nextflow run command based on what we know"""
 
+        # Collect the command parts and join them once at the end
+        cmd_parts = [self.nextflow_cmd]
+        # Arguments to run nextflow with directly, without quoting for a shell,
+        # starting from the 'nextflow run' arguments set with nextflow_cmd
+        self.nextflow_argv = list(self.nextflow_argv)
+
         # Core nextflow options
         for flag, val in self.nxf_flags.items():
-            # Boolean flags like -resume
-            if isinstance(val, bool) and val:
-                self.nextflow_cmd += f" {flag}"
+            if type(val) is bool:
+                # Boolean flags like -resume
+                if val:
+                    cmd_parts.append(flag)
+                    self.nextflow_argv.append(flag)
             # String values
-            elif not isinstance(val, bool):
-                self.nextflow_cmd += ' {} "{}"'.format(flag, val.replace('"', '\\"'))
+            else:
+                cmd_parts.append('{} "{}"'.format(flag, val.replace('"', '\\"')))
+                self.nextflow_argv.extend([flag, val])
 
         # Pipeline parameters
         if len(self.schema_obj.input_params) > 0:
@@ -702,20 +816,26 @@ class Launch:
             # Write the user selection to a file and run nextflow with that
             if self.use_params_file:
                 dump_json_with_prettier(self.params_out, self.schema_obj.input_params)
-                self.nextflow_cmd += f' -params-file "{os.path.relpath(self.params_out)}"'
+                cmd_parts.append(f'-params-file "{os.path.relpath(self.params_out)}"')
+                self.nextflow_argv.extend(["-params-file", os.path.relpath(self.params_out)])
 
             # Call nextflow with a list of command line flags
             else:
                 for param, val in self.schema_obj.input_params.items():
                     # Boolean flags like --saveTrimmed
-                    if isinstance(val, bool) and val:
-                        self.nextflow_cmd += f" --{param}"
+                    if type(val) is bool and val:
+                        cmd_parts.append(f"--{param}")
+                        self.nextflow_argv.append(f"--{param}")
                     # No quotes for numbers
-                    elif (isinstance(val, int) or isinstance(val, float)) and val:
-                        self.nextflow_cmd += " --{} {}".format(param, str(val).replace('"', '\\"'))
+                    elif isinstance(val, (int, float)) and val:
+                        cmd_parts.append("--{} {}".format(param, str(val).replace('"', '\\"')))
+                        self.nextflow_argv.extend([f"--{param}", str(val)])
                     # everything else
                     else:
-                        self.nextflow_cmd += ' --{} "{}"'.format(param, str(val).replace('"', '\\"'))
+                        cmd_parts.append('--{} "{}"'.format(param, str(val).replace('"', '\\"')))
+                        self.nextflow_argv.extend([f"--{param}", str(val)])
+
+        self.nextflow_cmd = " ".join(cmd_parts)
 
     def launch_workflow(self):
         """Launch nextflow if required"""
@@ -723,4 +843,4 @@ class Launch:
 
         if Confirm.ask("Do you want to run this command now? ", default=True):
             log.info("Launching workflow! :rocket:")
-            subprocess.call(self.nextflow_cmd, shell=True)
+            subprocess.run(self.nextflow_argv, check=False)
@@ -1,7 +1,8 @@
 import logging
-import os
 from pathlib import Path
 
+from nf_core.components.components_utils import find_component_dirs
+
 log = logging.getLogger(__name__)
 
 
@@ -14,13 +15,12 @@ def modules_structure(self):
         modules/nf-core/modules/TOOL/SUBTOOL
     """
     wrong_location_modules = []
-    for directory, _, files in os.walk(Path(self.wf_path, "modules")):
-        if "main.nf" in files:
-            module_path = Path(directory).relative_to(Path(self.wf_path, "modules"))
-            parts = module_path.parts
-            # Check that there are modules installed directly under the 'modules' directory
-            if parts[1] == "modules":
-                wrong_location_modules.append(module_path)
+    for module_dir in find_component_dirs(Path(self.wf_path, "modules")):
+        module_path = Path(module_dir)
+        parts = module_path.parts
+        # Check that there are modules installed directly under the 'modules' directory
+        if parts[1] == "modules":
+            wrong_location_modules.append(module_path)
     # If there are modules installed in the wrong location
     failed = []
     passed = []
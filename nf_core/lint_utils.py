@@ -91,6 +91,7 @@ def dump_json_with_prettier(file_name, file_content):
         file_name (Path | str): A file identifier as a string or pathlib.Path.
         file_content (dict): Content to dump into the JSON file
     """
+    # Serialise up front so the file is written in one go, rather than a chunk per JSON token
     with open(file_name, "w") as fh:
-        json.dump(file_content, fh, indent=4)
+        fh.write(json.dumps(file_content, indent=4))
     run_prettier_on_file(file_name)
@@ -45,7 +45,15 @@ def module_changes(module_lint_object, module):
     )
     modules_repo = nf_core.modules.modules_repo.ModulesRepo(remote_url=module.repo_url, branch=module.branch)
 
-    for f, same in modules_repo.module_files_identical(module.module_name, tempdir, module.git_sha).items():
+    try:
+        files_identical = modules_repo.module_files_identical(module.module_name, tempdir, module.git_sha)
+    except LookupError as e:
+        module.failed.append(
+            ("check_local_copy", f"Could not compare local copy of module with remote: {e}", module.module_dir)
+        )
+        return
+
+    for f, same in files_identical.items():
         if same:
             module.passed.append(
                 (
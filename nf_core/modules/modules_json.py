@@ -12,7 +12,10 @@ import questionary
 from git.exc import GitCommandError
 
 import nf_core.utils
-from nf_core.components.components_utils import get_components_to_install
+from nf_core.components.components_utils import (
+    find_component_dirs,
+    get_components_to_install,
+)
 from nf_core.lint_utils import dump_json_with_prettier
 from nf_core.modules.modules_repo import (
     NF_CORE_MODULES_NAME,
@@ -113,11 +116,7 @@ class ModulesJson:
             modules_repo = ModulesRepo(repo_url)
             components = (
                 repo_url,
-                [
-                    str(Path(component_name).relative_to(directory / modules_repo.repo_path))
-                    for component_name, _, file_names in os.walk(directory / modules_repo.repo_path)
-                    if "main.nf" in file_names
-                ],
+                find_component_dirs(directory / modules_repo.repo_path),
                 modules_repo.repo_path,
             )
             names.append(components)
@@ -259,6 +258,10 @@ class ModulesJson:
             repo_path = self.subworkflows_dir / install_dir
         # Get the branches present in the repository, as well as the default branch
         available_branches = ModulesRepo.get_remote_branches(remote_url)
+        # Walk the histories of all components on the default branch in one go
+        default_git_logs = default_modules_repo.get_component_git_logs(
+            [(component, component_type) for component in components], depth=1000
+        )
         sb_local = []
         dead_components = []
         repo_entry = {}
@@ -269,21 +272,24 @@ class ModulesJson:
             tried_branches = {default_modules_repo.branch}
             found_sha = False
             while True:
+                git_log = (
+                    default_git_logs[(component, component_type)] if modules_repo is default_modules_repo else None
+                )
                 # If the module/subworkflow is patched
                 patch_file = component_path / f"{component}.diff"
                 if patch_file.is_file():
                     temp_module_dir = self.try_apply_patch_reverse(component, install_dir, patch_file, component_path)
                     correct_commit_sha = self.find_correct_commit_sha(
-                        component_type, component, temp_module_dir, modules_repo
+                        component_type, component, temp_module_dir, modules_repo, git_log
                     )
                 else:
                     correct_commit_sha = self.find_correct_commit_sha(
-                        component_type, component, component_path, modules_repo
+                        component_type, component, component_path, modules_repo, git_log
                     )
                     if correct_commit_sha is None:
                         # Check in the old path
                         correct_commit_sha = self.find_correct_commit_sha(
-                            component_type, component, repo_path / component_type / component, modules_repo
+                            component_type, component, repo_path / component_type / component, modules_repo, git_log
                         )
                 if correct_commit_sha is None:
                     log.info(
@@ -334,7 +340,7 @@ class ModulesJson:
 
         return repo_entry
 
-    def find_correct_commit_sha(self, component_type, component_name, component_path, modules_repo):
+    def find_correct_commit_sha(self, component_type, component_name, component_path, modules_repo, git_log=None):
         """
         Returns the SHA for the latest commit where the local files are identical to the remote files
         Args:
@@ -342,6 +348,7 @@ class ModulesJson:
             component_name (str): Name of module/subowrkflow
             component_path (str): Path to module/subworkflow in local repo
             modules_repo (str): Remote repo for module/subworkflow
+            git_log ([dict]): Commit history of the module/subworkflow, if already fetched
         Returns:
             commit_sha (str): The latest commit SHA where local files are identical to remote files,
                               or None if no commit is found
@@ -349,12 +356,16 @@ class ModulesJson:
         # Find the correct commit SHA for the local module/subworkflow files.
         # We iterate over the commit history for the module/subworkflow until we find
         # a revision that matches the file contents
-        commit_shas = (
-            commit["git_sha"]
-            for commit in modules_repo.get_component_git_log(component_name, component_type, depth=1000)
-        )
+        if git_log is None:
+            git_log = modules_repo.get_component_git_log(component_name, component_type, depth=1000)
+        commit_shas = (commit["git_sha"] for commit in git_log)
+        # The local files are the same for every commit, so only hash them once
+        local_shas = modules_repo.get_local_file_shas(component_path)
         for commit_sha in commit_shas:
-            if all(modules_repo.module_files_identical(component_name, component_path, commit_sha).values()):
+            files_identical = modules_repo.module_files_identical(
+                component_name, component_path, commit_sha, local_shas
+            )
+            if all(files_identical.values()):
                 return commit_sha
         return None
 
@@ -398,18 +409,15 @@ class ModulesJson:
         missing_installation = copy.deepcopy(self.modules_json["repos"])
         # Obtain the path of all installed modules
         module_dirs = [
-            Path(dir_name).relative_to(self.modules_dir)
-            for dir_name, _, file_names in os.walk(self.modules_dir)
-            if "main.nf" in file_names and not str(Path(dir_name).relative_to(self.modules_dir)).startswith("local")
+            Path(dir_name) for dir_name in find_component_dirs(self.modules_dir) if not dir_name.startswith("local")
         ]
         untracked_dirs_modules, missing_installation = self.parse_dirs(module_dirs, missing_installation, "modules")
 
         # Obtain the path of all installed subworkflows
         subworkflow_dirs = [
-            Path(dir_name).relative_to(self.subworkflows_dir)
-            for dir_name, _, file_names in os.walk(self.subworkflows_dir)
-            if "main.nf" in file_names
-            and not str(Path(dir_name).relative_to(self.subworkflows_dir)).startswith("local")
+            Path(dir_name)
+            for dir_name in find_component_dirs(self.subworkflows_dir)
+            if not dir_name.startswith("local")
         ]
         untracked_dirs_subworkflows, missing_installation = self.parse_dirs(
             subworkflow_dirs, missing_installation, "subworkflows"
@@ -1,17 +1,23 @@
-import filecmp
+import concurrent.futures
+import functools
+import hashlib
 import logging
 import os
 import shutil
+import tarfile
+import tempfile
+import time
 from pathlib import Path
 
 import git
 import rich
 import rich.progress
+import yaml
 from git.exc import GitCommandError, InvalidGitRepositoryError
 
 import nf_core.modules.modules_json
 import nf_core.modules.modules_utils
-from nf_core.utils import NFCORE_DIR, load_tools_config
+from nf_core.utils import CONFIG_PATHS, DEPRECATED_CONFIG_PATHS, NFCORE_DIR
 
 log = logging.getLogger(__name__)
 
@@ -20,6 +26,52 @@ NF_CORE_MODULES_NAME = "nf-core"
 NF_CORE_MODULES_REMOTE = "https://github.com/nf-core/modules.git"
 NF_CORE_MODULES_DEFAULT_BRANCH = "master"
 
+# Number of seconds to reuse the branch heads listed from a remote
+REMOTE_HEADS_CACHE_TTL = 60
+
+# File in the local repositories recording when they were last synced with the remote.
+# Syncing is skipped for NFCORE_FETCH_TTL seconds after that, also by later processes.
+FETCH_STAMP_FILE = ".nf-core-fetch-stamp"
+DEFAULT_FETCH_TTL = 300
+
+# Minimum number of seconds between two refreshes of a remote progress bar
+PROGRESS_UPDATE_INTERVAL = 1 / 30
+
+# Only extract regular files and directories from archives, where Python supports it
+TAR_EXTRACT_KWARGS = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+
+
+def _strip_archive_prefix(tar, prefix):
+    """
+    Yields the members of a tar archive that are below the given prefix, relative to it
+    """
+    for member in tar:
+        if member.name.startswith(prefix) and (member.isfile() or member.isdir()):
+            member.name = member.name[len(prefix) :]
+            yield member
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_tools_config(blob_sha, contents):
+    """
+    Parses the contents of a tools config file, cached on the SHA of its git blob
+    """
+    return yaml.safe_load(contents) or {}
+
+
+@functools.lru_cache()
+def _parse_fetch_ttl(value):
+    """
+    Parses the NFCORE_FETCH_TTL environment variable, once for each value
+    """
+    if value is None:
+        return DEFAULT_FETCH_TTL
+    try:
+        return float(value)
+    except ValueError:
+        log.warning(f"Invalid NFCORE_FETCH_TTL '{value}', using the default of {DEFAULT_FETCH_TTL} seconds")
+        return DEFAULT_FETCH_TTL
+
 
 class RemoteProgressbar(git.RemoteProgress):
     """
@@ -45,17 +97,22 @@ class RemoteProgressbar(git.RemoteProgress):
             start=False,
             state="Waiting for response",
         )
+        self.last_update = 0.0
 
     def update(self, op_code, cur_count, max_count=None, message=""):
         """
         Overrides git.RemoteProgress.update.
         Called every time there is a change in the remote operation
         """
+        # Skip intermediate updates that come faster than we want to redraw
+        now = time.monotonic()
+        if now - self.last_update < PROGRESS_UPDATE_INTERVAL and cur_count != max_count:
+            return
+        self.last_update = now
         if not self.progress_bar.tasks[self.tid].started:
             self.progress_bar.start_task(self.tid)
-        self.progress_bar.update(
-            self.tid, total=max_count, completed=cur_count, state=f"{cur_count / max_count * 100:.1f}%"
-        )
+        state = f"{cur_count / max_count * 100:.1f}%" if max_count else "Waiting for response"
+        self.progress_bar.update(self.tid, total=max_count, completed=cur_count, state=state)
 
 
 class ModulesRepo:
@@ -68,9 +125,20 @@ class ModulesRepo:
     We keep track of the pull-status of the different installed repos in
     the static variable local_repo_status. This is so we don't need to
     pull a remote several times in one command.
+
+    The branch heads of each remote are also cached for a short time in
+    remote_heads_cache, so that we only fetch when the remote has changed.
+
+    The git.Repo object of each local repository and the caches of what has been
+    read from it are shared by all objects using it, in local_repos.
+
+    The local repositories are bare clones whose branches mirror the remote.
+    Everything is read from the git object database, nothing is checked out.
     """
 
     local_repo_statuses = {}
+    remote_heads_cache = {}
+    local_repos = {}
     no_pull_global = False
 
     @staticmethod
@@ -99,24 +167,37 @@ class ModulesRepo:
             (set[str]): All branches found in the remote
         """
         try:
-            unparsed_branches = git.Git().ls_remote(remote_url)
+            return set(ModulesRepo.get_remote_heads(remote_url))
         except git.GitCommandError:
             raise LookupError(f"Was unable to fetch branches from '{remote_url}'")
-        else:
-            branches = {}
-            for branch_info in unparsed_branches.split("\n"):
-                sha, name = branch_info.split("\t")
-                if name != "HEAD":
-                    # The remote branches are shown as 'ref/head/branch'
-                    branch_name = Path(name).stem
-                    branches[sha] = branch_name
-            return set(branches.values())
+
+    @staticmethod
+    def get_remote_heads(remote_url):
+        """
+        Get the commit SHA of every branch head in a remote repository.
+        The result is cached for REMOTE_HEADS_CACHE_TTL seconds.
+
+        Args:
+            remote_url (str): The git url to the remote repository
+
+        Returns:
+            (dict[str, str]): Commit SHAs keyed by branch name
+        """
+        cached = ModulesRepo.remote_heads_cache.get(remote_url)
+        if cached is not None and time.monotonic() - cached[0] < REMOTE_HEADS_CACHE_TTL:
+            return cached[1]
+        remote_heads = {}
+        # Only list the branch heads, and let the server filter them with protocol v2
+        for head_info in git.Git()(c="protocol.version=2").ls_remote("--heads", remote_url).splitlines():
+            sha, name = head_info.split("\t", 1)
+            remote_heads[name[len("refs/heads/") :]] = sha
+        ModulesRepo.remote_heads_cache[remote_url] = (time.monotonic(), remote_heads)
+        return remote_heads
 
     def __init__(self, remote_url=None, branch=None, no_pull=False, hide_progress=False):
         """
         Initializes the object and clones the git repository if it is not already present
         """
-
         # This allows us to set this one time and then keep track of the user's choice
         ModulesRepo.no_pull_global |= no_pull
 
@@ -130,7 +211,7 @@ class ModulesRepo:
 
         self.setup_local_repo(remote_url, branch, hide_progress)
 
-        config_fn, repo_config = load_tools_config(self.local_repo_dir)
+        config_fn, repo_config = self.load_tools_config()
         try:
             self.repo_path = repo_config["org_path"]
         except KeyError:
@@ -140,10 +221,6 @@ class ModulesRepo:
         if self.repo_path != NF_CORE_MODULES_NAME or self.branch:
             self.verify_branch()
 
-        # Convenience variable
-        self.modules_dir = os.path.join(self.local_repo_dir, "modules", self.repo_path)
-        self.subworkflows_dir = os.path.join(self.local_repo_dir, "subworkflows", self.repo_path)
-
         self.avail_module_names = None
 
     def verify_sha(self, prompt, sha):
@@ -169,8 +246,8 @@ class ModulesRepo:
     def setup_local_repo(self, remote, branch, hide_progress=True):
         """
         Sets up the local git repository. If the repository has been cloned previously, it
-        returns a git.Repo object of that clone. Otherwise it tries to clone the repository from
-        the provided remote URL and returns a git.Repo of the new clone.
+        returns a git.Repo object of that clone. Otherwise it tries to make a bare clone of the
+        repository from the provided remote URL and returns a git.Repo of the new clone.
 
         Args:
             remote (str): git url of remote
@@ -181,53 +258,47 @@ class ModulesRepo:
         try:
             if not os.path.exists(self.local_repo_dir):
                 try:
-                    pbar = rich.progress.Progress(
-                        "[bold blue]{task.description}",
-                        rich.progress.BarColumn(bar_width=None),
-                        "[bold yellow]{task.fields[state]}",
-                        transient=True,
-                        disable=hide_progress or os.environ.get("HIDE_PROGRESS", None) is not None,
-                    )
-                    with pbar:
-                        self.repo = git.Repo.clone_from(
-                            remote,
-                            self.local_repo_dir,
-                            progress=RemoteProgressbar(pbar, self.fullname, self.remote_url, "Cloning"),
-                        )
+                    self.use_local_repo(self.clone_local_repo(remote, self.local_repo_dir, hide_progress))
+                    self.write_fetch_stamp()
                     ModulesRepo.update_local_repo_status(self.fullname, True)
                 except GitCommandError:
                     raise LookupError(f"Failed to clone from the remote: `{remote}`")
-                # Verify that the requested branch exists by checking it out
+                # Verify that the requested branch exists
                 self.setup_branch(branch)
             else:
-                self.repo = git.Repo(self.local_repo_dir)
+                self.use_local_repo()
+                if not self.repo.bare and not ModulesRepo.no_pull_global:
+                    # Older versions kept a full clone with a working tree, replace it with a bare clone.
+                    # The old clone is only removed once the new one is complete.
+                    log.info(f"Replacing '{self.local_repo_dir}' with a bare clone")
+                    clone_dir = tempfile.mkdtemp(dir=os.path.dirname(self.local_repo_dir))
+                    try:
+                        self.clone_local_repo(remote, clone_dir, hide_progress).close()
+                    except GitCommandError:
+                        shutil.rmtree(clone_dir)
+                        raise LookupError(f"Failed to clone from the remote: `{remote}`")
+                    self.repo.close()
+                    shutil.rmtree(self.local_repo_dir)
+                    os.replace(clone_dir, self.local_repo_dir)
+                    self.use_local_repo(git.Repo(self.local_repo_dir))
+                    self.write_fetch_stamp()
+                    ModulesRepo.update_local_repo_status(self.fullname, True)
 
-                if ModulesRepo.no_pull_global:
+                if ModulesRepo.no_pull_global or self.fetched_recently():
                     ModulesRepo.update_local_repo_status(self.fullname, True)
+                # A branch that is missing locally may have been created on the remote since the last sync
+                branch_missing = branch is not None and branch not in self.repo.heads
                 # If the repo is already cloned, fetch the latest changes from the remote
-                if not ModulesRepo.local_repo_synced(self.fullname):
-                    pbar = rich.progress.Progress(
-                        "[bold blue]{task.description}",
-                        rich.progress.BarColumn(bar_width=None),
-                        "[bold yellow]{task.fields[state]}",
-                        transient=True,
-                        disable=hide_progress or os.environ.get("HIDE_PROGRESS", None) is not None,
-                    )
-                    with pbar:
-                        self.repo.remotes.origin.fetch(
-                            progress=RemoteProgressbar(pbar, self.fullname, self.remote_url, "Pulling")
-                        )
+                if not ModulesRepo.local_repo_synced(self.fullname) or (
+                    branch_missing and not ModulesRepo.no_pull_global
+                ):
+                    if branch_missing or self.remote_has_changed():
+                        self.fetch_local_repo(hide_progress)
+                    self.write_fetch_stamp()
                     ModulesRepo.update_local_repo_status(self.fullname, True)
 
-                # Before verifying the branch, fetch the changes
-                # Verify that the requested branch exists by checking it out
+                # Verify that the requested branch exists, now that the changes are fetched
                 self.setup_branch(branch)
-
-                # Now merge the changes
-                tracking_branch = self.repo.active_branch.tracking_branch()
-                if tracking_branch is None:
-                    raise LookupError(f"There is no remote tracking branch '{self.branch}' in '{self.remote_url}'")
-                self.repo.git.merge(tracking_branch.name)
         except (GitCommandError, InvalidGitRepositoryError) as e:
             log.error(f"[red]Could not set up local cache of modules repository:[/]\n{e}\n")
             if rich.prompt.Confirm.ask(f"[violet]Delete local cache '{self.local_repo_dir}' and try again?"):
@@ -237,10 +308,144 @@ class ModulesRepo:
             else:
                 raise LookupError("Exiting due to error with local modules git repo")
 
+    def clone_local_repo(self, remote, repo_dir, hide_progress=True):
+        """
+        Makes a bare clone of the remote, whose branches mirror the remote branches
+
+        Args:
+            remote (str): git url of remote
+            repo_dir (str): The directory to clone into
+
+        Returns:
+            (git.Repo): The new clone
+        """
+        pbar = rich.progress.Progress(
+            "[bold blue]{task.description}",
+            rich.progress.BarColumn(bar_width=None),
+            "[bold yellow]{task.fields[state]}",
+            transient=True,
+            disable=hide_progress or os.environ.get("HIDE_PROGRESS", None) is not None,
+        )
+        # Do a partial clone without file contents, these are fetched when they are first read.
+        # Set NFCORE_FULL_CLONE to clone the complete repository instead.
+        clone_options = [] if os.environ.get("NFCORE_FULL_CLONE") else ["--filter=blob:none"]
+        with pbar:
+            repo = git.Repo.clone_from(
+                remote,
+                repo_dir,
+                progress=RemoteProgressbar(pbar, self.fullname, self.remote_url, "Cloning"),
+                bare=True,
+                multi_options=clone_options,
+            )
+        # Fetch the remote branches straight into the local branches
+        repo.git.config("remote.origin.fetch", "+refs/heads/*:refs/heads/*")
+        return repo
+
+    def fetch_local_repo(self, hide_progress=True):
+        """
+        Fetches the latest changes from the remote into the local branches
+        """
+        pbar = rich.progress.Progress(
+            "[bold blue]{task.description}",
+            rich.progress.BarColumn(bar_width=None),
+            "[bold yellow]{task.fields[state]}",
+            transient=True,
+            disable=hide_progress or os.environ.get("HIDE_PROGRESS", None) is not None,
+        )
+        with pbar:
+            self.repo.remotes.origin.fetch(progress=RemoteProgressbar(pbar, self.fullname, self.remote_url, "Pulling"))
+        ModulesRepo.local_repos[self.local_repo_dir]["fetched"] = True
+
+    def fetch_once(self):
+        """
+        Fetches the latest changes from the remote when something is missing locally, unless
+        pulling is disabled or this process has already cloned or fetched the repository
+
+        Returns:
+            (bool): Whether the local repository has been fetched
+        """
+        local_repo = ModulesRepo.local_repos[self.local_repo_dir]
+        if ModulesRepo.no_pull_global or local_repo["fetched"]:
+            return False
+        try:
+            self.fetch_local_repo()
+        except GitCommandError as e:
+            log.debug(f"Could not fetch from '{self.remote_url}': {e}")
+            # Don't try again for everything else that is missing
+            local_repo["fetched"] = True
+            return False
+        self.write_fetch_stamp()
+        return True
+
+    def use_local_repo(self, repo=None):
+        """
+        Sets self.repo and the caches of what has been read from it, sharing them with the
+        other objects using the same local repository. Everything is cached by commit SHA,
+        so objects on different branches can share them.
+
+        Args:
+            repo (git.Repo): A new Repo object for the local repository, replacing the shared one
+        """
+        if repo is not None or self.local_repo_dir not in ModulesRepo.local_repos:
+            ModulesRepo.local_repos[self.local_repo_dir] = {
+                "repo": repo or git.Repo(self.local_repo_dir),
+                # Available modules/subworkflows, keyed by commit SHA and component type
+                "avail_components": {},
+                # Results of commit lookups and git log walks, keyed by the tip of the branch
+                # so that they are not reused once a fetch has moved the branch
+                "branch_commits": {},
+                "component_git_logs": {},
+                # Whether the repository has been cloned or fetched by this process
+                "fetched": repo is not None,
+            }
+        local_repo = ModulesRepo.local_repos[self.local_repo_dir]
+        self.repo = local_repo["repo"]
+        self.avail_components_cache = local_repo["avail_components"]
+        self.branch_commits = local_repo["branch_commits"]
+        self.component_git_logs = local_repo["component_git_logs"]
+
+    def fetched_recently(self):
+        """
+        Checks whether the local repository was synced with the remote less than
+        NFCORE_FETCH_TTL seconds ago, possibly by another nf-core process
+
+        Returns:
+            (bool): True if we can skip syncing with the remote
+        """
+        try:
+            with open(os.path.join(self.local_repo_dir, FETCH_STAMP_FILE)) as fh:
+                last_fetched = float(fh.read())
+        except (OSError, ValueError):
+            return False
+        return time.time() - last_fetched < _parse_fetch_ttl(os.environ.get("NFCORE_FETCH_TTL"))
+
+    def write_fetch_stamp(self):
+        """
+        Records that the local repository has just been synced with the remote
+        """
+        with open(os.path.join(self.local_repo_dir, FETCH_STAMP_FILE), "w") as fh:
+            fh.write(str(time.time()))
+
+    def remote_has_changed(self):
+        """
+        Checks whether any branch head in the remote differs from our local branches,
+        using a single ls-remote call instead of a fetch
+
+        Returns:
+            (bool): True if we need to fetch from the remote
+        """
+        try:
+            remote_heads = ModulesRepo.get_remote_heads(self.remote_url)
+        except GitCommandError:
+            # Let the fetch report the problem
+            return True
+        local_heads = {head.name: head.commit.hexsha for head in self.repo.heads}
+        return any(local_heads.get(branch) != sha for branch, sha in remote_heads.items())
+
     def setup_branch(self, branch):
         """
         Verify that we have a branch and otherwise use the default one.
-        The branch is then checked out to verify that it exists in the repo.
+        Then verify that the branch exists in the repo.
 
         Args:
             branch (str): Name of branch
@@ -254,31 +459,40 @@ class ModulesRepo:
         else:
             self.branch = branch
 
-        # Verify that the branch exists by checking it out
         self.branch_exists()
 
     def get_default_branch(self):
         """
-        Gets the default branch for the repo (the branch origin/HEAD is pointing to)
+        Gets the default branch for the repo (the branch HEAD of the bare clone is pointing to,
+        which is the default branch of the remote)
         """
-        origin_head = next(ref for ref in self.repo.refs if ref.name == "origin/HEAD")
-        _, branch = origin_head.ref.name.split("/")
-        return branch
+        if not self.repo.bare:
+            # Full clones made by older versions, where HEAD is the last checked out branch
+            return self.repo.git.symbolic_ref("refs/remotes/origin/HEAD", short=True).split("/", 1)[1]
+        # Read the single symbolic ref instead of listing all references
+        return self.repo.git.symbolic_ref("HEAD", short=True)
 
     def branch_exists(self):
         """
-        Verifies that the branch exists in the repository by trying to check it out
+        Verifies that the branch exists in the repository
         """
-        try:
-            self.checkout_branch()
-        except GitCommandError:
-            raise LookupError(f"Branch '{self.branch}' not found in '{self.remote_url}'")
+        if self.branch in self.repo.heads:
+            return
+        if not self.repo.bare:
+            # Full clones made by older versions only have local branches for the branches that
+            # were checked out, so create it from the remote branch like 'git checkout' would
+            try:
+                self.repo.create_head(self.branch, self.repo.remotes.origin.refs[self.branch])
+                return
+            except IndexError:
+                pass
+        raise LookupError(f"Branch '{self.branch}' not found in '{self.remote_url}'")
 
     def verify_branch(self):
         """
-        Verifies the active branch conforms do the correct directory structure
+        Verifies the branch conforms do the correct directory structure
         """
-        dir_names = os.listdir(self.local_repo_dir)
+        dir_names = [tree.name for tree in self.repo.commit(self.branch).tree.trees]
         if "modules" not in dir_names:
             err_str = f"Repository '{self.remote_url}' ({self.branch}) does not contain the 'modules/' directory"
             if "software" in dir_names:
@@ -287,47 +501,18 @@ class ModulesRepo:
                 )
             raise LookupError(err_str)
 
-    def checkout_branch(self):
-        """
-        Checks out the specified branch of the repository
-        """
-        self.repo.git.checkout(self.branch)
-
-    def checkout(self, commit):
-        """
-        Checks out the repository at the requested commit
-
-        Args:
-            commit (str): Git SHA of the commit
-        """
-        self.repo.git.checkout(commit)
-
-    def component_exists(self, component_name, component_type, checkout=True):
+    def component_exists(self, component_name, component_type, commit=None):
         """
         Check if a module/subworkflow exists in the branch of the repo
 
         Args:
             component_name (str): The name of the module/subworkflow
+            commit (str): Look at this commit instead of the tip of the branch
 
         Returns:
             (bool): Whether the module/subworkflow exists in this branch of the repository
         """
-        return component_name in self.get_avail_components(component_type, checkout=checkout)
-
-    def get_component_dir(self, component_name, component_type):
-        """
-        Returns the file path of a module/subworkflow directory in the repo.
-        Does not verify that the path exists.
-        Args:
-            component_name (str): The name of the module/subworkflow
-
-        Returns:
-            component_path (str): The path of the module/subworkflow in the local copy of the repository
-        """
-        if component_type == "modules":
-            return os.path.join(self.modules_dir, component_name)
-        elif component_type == "subworkflows":
-            return os.path.join(self.subworkflows_dir, component_name)
+        return component_name in self.get_avail_components(component_type, commit=commit)
 
     def install_component(self, component_name, install_dir, commit, component_type):
         """
@@ -341,51 +526,204 @@ class ModulesRepo:
         Returns:
             (bool): Whether the operation was successful or not
         """
-        # Check out the repository at the requested ref
+        # Check if the module/subworkflow exists at the requested ref
         try:
-            self.checkout(commit)
-        except git.GitCommandError:
+            component_exists = self.component_exists(component_name, component_type, commit=commit)
+        except (ValueError, git.BadName, GitCommandError):
             return False
-
-        # Check if the module/subworkflow exists in the branch
-        if not self.component_exists(component_name, component_type, checkout=False):
+        if not component_exists:
             log.error(
                 f"The requested {component_type[:-1]} does not exists in the branch '{self.branch}' of {self.remote_url}'"
             )
             return False
 
-        # Copy the files from the repo to the install folder
-        shutil.copytree(self.get_component_dir(component_name, component_type), Path(install_dir, component_name))
-
-        # Switch back to the tip of the branch
-        self.checkout_branch()
+        # Extract the files at the requested ref into a temporary folder, so that
+        # nothing is left in the pipeline if the archive can't be read completely
+        prefix = f"{component_type}/{self.repo_path}/"
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            try:
+                archive = self.repo.git.archive(commit, "--", f"{prefix}{component_name}", as_process=True)
+                with tarfile.open(fileobj=archive.stdout, mode="r|") as tar:
+                    tar.extractall(tmp_dir, members=_strip_archive_prefix(tar, prefix), **TAR_EXTRACT_KWARGS)
+                # Raises a GitCommandError if git archive exited with an error
+                archive.wait()
+            except (tarfile.TarError, GitCommandError) as e:
+                log.error(f"Could not extract the {component_type[:-1]} '{component_name}' at '{commit}':\n{e}")
+                return False
+            component_dir = Path(install_dir, component_name)
+            component_dir.parent.mkdir(parents=True, exist_ok=True)
+            shutil.move(os.path.join(tmp_dir, component_name), component_dir)
         return True
 
-    def module_files_identical(self, module_name, base_path, commit):
+    def module_files_identical(self, module_name, base_path, commit, local_shas=None):
         """
-        Checks whether the module files in a pipeline are identical to the ones in the remote
+        Checks whether the module files in a pipeline are identical to the ones in the remote.
+        The git blob SHA of each pipeline file is compared with the one in the repository tree,
+        so the remote file contents are never read.
+
         Args:
             module_name (str): The name of the module
             base_path (str): The path to the module in the pipeline
+            commit (str): The commit to compare against
+            local_shas (dict): The SHAs of the pipeline files from get_local_file_shas,
+                               to not hash them again when comparing against several commits
 
         Returns:
             (bool): Whether the pipeline files are identical to the repo files
+
+        Raises:
+            LookupError: If the commit is not found in the repository
+        """
+        if local_shas is None:
+            local_shas = self.get_local_file_shas(base_path)
+        tree = self._commit_tree(commit)
+        if tree is None and self.fetch_once():
+            tree = self._commit_tree(commit)
+        if tree is None:
+            raise LookupError(f"Commit '{commit}' not found in '{self.remote_url}'")
+        module_path = f"modules/{self.repo_path}/{module_name}"
+        files_identical = {file: True for file in local_shas}
+        for file, local_sha in local_shas.items():
+            remote_sha = self._tree_file_sha(tree, f"{module_path}/{file}")
+            if remote_sha is None:
+                log.debug(f"Could not find file in the repository: {module_path}/{file}")
+                continue
+            if local_sha is None:
+                log.debug(f"Could not open file: {os.path.join(base_path, file)}")
+                continue
+            files_identical[file] = remote_sha == local_sha
+        return files_identical
+
+    @staticmethod
+    def get_local_file_shas(base_path, files=("main.nf", "meta.yml")):
         """
-        if commit is None:
-            self.checkout_branch()
-        else:
-            self.checkout(commit)
-        module_files = ["main.nf", "meta.yml"]
-        files_identical = {file: True for file in module_files}
-        module_dir = self.get_component_dir(module_name, "modules")
-        for file in module_files:
+        Hashes the module files in a pipeline the same way git hashes blobs
+
+        Args:
+            base_path (str): The path to the module in the pipeline
+            files ([str]): The files to hash
+
+        Returns:
+            (dict): The SHA of each file, or None if it can't be read, keyed by file name
+        """
+        local_shas = {}
+        for file in files:
             try:
-                files_identical[file] = filecmp.cmp(os.path.join(module_dir, file), os.path.join(base_path, file))
+                with open(os.path.join(base_path, file), "rb") as fh:
+                    contents = fh.read()
             except FileNotFoundError:
-                log.debug(f"Could not open file: {os.path.join(module_dir, file)}")
-                continue
-        self.checkout_branch()
-        return files_identical
+                local_shas[file] = None
+            else:
+                local_shas[file] = hashlib.sha1(b"blob %d\0" % len(contents) + contents).hexdigest()
+        return local_shas
+
+    def get_component_file_sha(self, component_name, component_type, file_name, commit=None):
+        """
+        Gets the git blob SHA of a file of a module/subworkflow from the repository tree,
+        without reading the file itself
+
+        Args:
+            component_name (str): The name of the module/subworkflow
+            component_type (str): Either 'modules' or 'subworkflows'
+            file_name (str): The path of the file within the module/subworkflow directory
+            commit (str): The commit to look at. Defaults to the tip of the branch
+
+        Returns:
+            (str): The SHA of the file, or None if it does not exist
+        """
+        tree = self._commit_tree(commit)
+        if tree is None:
+            return None
+        return self._tree_file_sha(tree, f"{component_type}/{self.repo_path}/{component_name}/{file_name}")
+
+    def _commit_tree(self, commit=None):
+        """
+        Gets the tree of a commit
+
+        Returns:
+            (git.Tree | None): The tree, or None if the commit is not found
+        """
+        try:
+            return self.repo.commit(commit or self.branch).tree
+        except (ValueError, git.BadName, git.BadObject):
+            return None
+
+    @staticmethod
+    def _tree_file_sha(tree, path):
+        """
+        Gets the git blob SHA of a file in a tree
+
+        Returns:
+            (str): The SHA of the file, or None if it does not exist
+        """
+        try:
+            blob = tree / path
+        except KeyError:
+            return None
+        if blob.type != "blob":
+            return None
+        return blob.hexsha
+
+    def get_component_file(self, component_name, component_type, file_name, commit=None):
+        """
+        Reads a file of a module/subworkflow from the git object database
+
+        Args:
+            component_name (str): The name of the module/subworkflow
+            component_type (str): Either 'modules' or 'subworkflows'
+            file_name (str): The path of the file within the module/subworkflow directory
+            commit (str): The commit to read the file at. Defaults to the tip of the branch
+
+        Returns:
+            (bytes): The contents of the file, or None if it does not exist
+        """
+        # Resolve '<commit>:<path>' in the persistent 'git cat-file --batch' process
+        try:
+            _, object_type, _, contents = self.repo.git.get_object_data(
+                f"{commit or self.branch}:{component_type}/{self.repo_path}/{component_name}/{file_name}"
+            )
+        except ValueError:
+            return None
+        if object_type != b"blob":
+            return None
+        return contents
+
+    def load_tools_config(self):
+        """
+        Loads the tools config file ('.nf-core.yml') at the tip of the branch, in the same
+        way as nf_core.utils.load_tools_config
+
+        Returns:
+            (Path, dict): The path of the config file and its contents
+        """
+        for config_name in CONFIG_PATHS:
+            blob = self._read_branch_blob(config_name)
+            if blob is not None:
+                return Path(self.local_repo_dir, config_name), _parse_tools_config(*blob)
+        depr_name = next((name for name in DEPRECATED_CONFIG_PATHS if self._read_branch_blob(name)), None)
+        if depr_name:
+            log.error(
+                f"Deprecated `{depr_name}` file found! The file will not be loaded. "
+                f"Please rename the file to `{CONFIG_PATHS[0]}`."
+            )
+        else:
+            log.debug(f"No tools config file found: {CONFIG_PATHS[0]}")
+        return Path(self.local_repo_dir, CONFIG_PATHS[0]), {}
+
+    def _read_branch_blob(self, path):
+        """
+        Reads a file at the tip of the branch from the git object database
+
+        Returns:
+            (bytes, bytes): The SHA and contents of the file, or None if it does not exist
+        """
+        try:
+            blob_sha, object_type, _, contents = self.repo.git.get_object_data(f"{self.branch}:{path}")
+        except ValueError:
+            return None
+        if object_type != b"blob":
+            return None
+        return blob_sha, contents
 
     def get_component_git_log(self, component_name, component_type, depth=None):
         """
@@ -399,21 +737,61 @@ class ModulesRepo:
         Returns:
             ( dict ): Iterator of commit SHAs and associated (truncated) message
         """
-        self.checkout_branch()
+        cache_key = (self.repo.commit(self.branch).hexsha, component_name, component_type, depth)
+        if cache_key not in self.component_git_logs:
+            self.component_git_logs[cache_key] = self._component_git_log(
+                self.repo, component_name, component_type, depth
+            )
+        return iter(self.component_git_logs[cache_key])
+
+    def get_component_git_logs(self, components, depth=None):
+        """
+        Fetches the commit history of several modules/subworkflows at once, walking the
+        histories concurrently. Each worker opens its own Repo object, as they are not
+        safe to share between threads.
+
+        Args:
+            components ([(str, str)]): Names and types of the modules/subworkflows
+            depth (int): Maximum number of commits to return per module/subworkflow
+
+        Returns:
+            (dict): Lists of commit SHAs and (truncated) messages, keyed by (name, type)
+        """
+
+        branch_sha = self.repo.commit(self.branch).hexsha
+
+        def worker(component):
+            with git.Repo(self.local_repo_dir) as repo:
+                return self._component_git_log(repo, *component, depth)
+
+        components = list(components)
+        missing = [
+            component
+            for component in dict.fromkeys(components)
+            if (branch_sha, *component, depth) not in self.component_git_logs
+        ]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for component, commits in zip(missing, executor.map(worker, missing)):
+                self.component_git_logs[(branch_sha, *component, depth)] = commits
+        return {component: self.component_git_logs[(branch_sha, *component, depth)] for component in components}
+
+    def _component_git_log(self, repo, component_name, component_type, depth):
+        """
+        Lists the commits on the branch touching a module/subworkflow, newest first,
+        using the given Repo object
+        """
         component_path = os.path.join(component_type, self.repo_path, component_name)
-        commits_new = self.repo.iter_commits(max_count=depth, paths=component_path)
-        commits_new = [
-            {"git_sha": commit.hexsha, "trunc_message": commit.message.partition("\n")[0]} for commit in commits_new
+        commits = [
+            {"git_sha": commit.hexsha, "trunc_message": commit.message.partition("\n")[0]}
+            for commit in repo.iter_commits(self.branch, max_count=depth, paths=component_path)
         ]
-        commits_old = []
         if component_type == "modules":
             # Grab commits also from previous modules structure
             component_path = os.path.join("modules", component_name)
-            commits_old = self.repo.iter_commits(max_count=depth, paths=component_path)
-            commits_old = [
-                {"git_sha": commit.hexsha, "trunc_message": commit.message.partition("\n")[0]} for commit in commits_old
+            commits += [
+                {"git_sha": commit.hexsha, "trunc_message": commit.message.partition("\n")[0]}
+                for commit in repo.iter_commits(self.branch, max_count=depth, paths=component_path)
             ]
-        commits = iter(commits_new + commits_old)
         return commits
 
     def get_latest_component_version(self, component_name, component_type):
@@ -426,8 +804,7 @@ class ModulesRepo:
         """
         Verifies that a given commit sha exists on the branch
         """
-        self.checkout_branch()
-        return sha in (commit.hexsha for commit in self.repo.iter_commits())
+        return self._branch_commit(sha) is not None
 
     def get_commit_info(self, sha):
         """
@@ -440,16 +817,59 @@ class ModulesRepo:
         Raises:
             LookupError: If the search for the commit fails
         """
-        self.checkout_branch()
-        for commit in self.repo.iter_commits():
-            if commit.hexsha == sha:
-                message = commit.message.partition("\n")[0]
-                date_obj = commit.committed_datetime
-                date = str(date_obj.date())
-                return message, date
-        raise LookupError(f"Commit '{sha}' not found in the '{self.remote_url}'")
+        commit = self._branch_commit(sha)
+        if commit is None:
+            raise LookupError(f"Commit '{sha}' not found in the '{self.remote_url}'")
+        message = commit.message.partition("\n")[0]
+        date = str(commit.committed_datetime.date())
+        return message, date
+
+    def _branch_commit(self, sha):
+        """
+        Looks up a commit on the branch by its full SHA, remembering the result for the current tip of the branch.
+        The sync may have been skipped, so we fetch once before reporting a commit as missing.
+
+        Returns:
+            (git.Commit | None): The commit, or None if the SHA is not a commit on the branch
+        """
+        commit = self._branch_commit_at_tip(sha)
+        if commit is None and self.fetch_once():
+            commit = self._branch_commit_at_tip(sha)
+        return commit
+
+    def _branch_commit_at_tip(self, sha):
+        """
+        Looks up a commit on the branch by its full SHA, remembering the result for the current tip of the branch
+
+        Returns:
+            (git.Commit | None): The commit, or None if the SHA is not a commit on the branch
+        """
+        branch_tip = self.repo.commit(self.branch)
+        cache_key = (branch_tip.hexsha, sha)
+        if cache_key not in self.branch_commits:
+            commit = self._lookup_commit(sha)
+            if commit is not None and not self.repo.is_ancestor(commit, branch_tip):
+                commit = None
+            self.branch_commits[cache_key] = commit
+        return self.branch_commits[cache_key]
 
-    def get_avail_components(self, component_type, checkout=True):
+    def _lookup_commit(self, sha):
+        """
+        Looks up a commit by its full SHA in the object database
+
+        Returns:
+            (git.Commit | None): The commit, or None if the SHA is not a known commit
+        """
+        try:
+            commit = self.repo.commit(sha)
+            # Full SHAs are resolved lazily, so read the object to make sure it exists
+            commit.committed_date
+        except (ValueError, git.BadName, git.BadObject):
+            return None
+        # Don't accept abbreviated SHAs or other revision names
+        return commit if commit.hexsha == sha else None
+
+    def get_avail_components(self, component_type, commit=None):
         """
         Gets the names of the modules/subworkflows in the repository. They are detected by
         checking which directories have a 'main.nf' file
@@ -457,20 +877,18 @@ class ModulesRepo:
         Returns:
             ([ str ]): The module/subworkflow names
         """
-        if checkout:
-            self.checkout_branch()
-        # Get directory
-        if component_type == "modules":
-            directory = self.modules_dir
-        elif component_type == "subworkflows":
-            directory = self.subworkflows_dir
-        # Module/Subworkflow directories are characterized by having a 'main.nf' file
-        avail_component_names = [
-            os.path.relpath(dirpath, start=directory)
-            for dirpath, _, file_names in os.walk(directory)
-            if "main.nf" in file_names
-        ]
-        return avail_component_names
+        commit = self.repo.commit(commit or self.branch)
+        cache_key = (commit.hexsha, component_type)
+        if cache_key not in self.avail_components_cache:
+            # Module/Subworkflow directories are characterized by having a 'main.nf' file
+            directory = f"{component_type}/{self.repo_path}"
+            file_paths = self.repo.git.ls_tree("-r", "--name-only", commit.hexsha, "--", directory).splitlines()
+            self.avail_components_cache[cache_key] = [
+                os.path.relpath(os.path.dirname(file_path), start=directory)
+                for file_path in file_paths
+                if os.path.basename(file_path) == "main.nf"
+            ]
+        return list(self.avail_components_cache[cache_key])
 
     def get_meta_yml(self, component_type, module_name):
         """
@@ -482,15 +900,9 @@ class ModulesRepo:
         Returns:
             (str): The contents of the file in text format
         """
-        self.checkout_branch()
-        if component_type == "modules":
-            path = Path(self.modules_dir, module_name, "meta.yml")
-        elif component_type == "subworkflows":
-            path = Path(self.subworkflows_dir, module_name, "meta.yml")
-        else:
+        if component_type not in ("modules", "subworkflows"):
             raise ValueError(f"Invalid component type: {component_type}")
-        if not path.exists():
+        contents = self.get_component_file(module_name, component_type, "meta.yml")
+        if contents is None:
             return None
-        with open(path) as fh:
-            contents = fh.read()
-        return contents
+        return contents.decode()
@@ -6,7 +6,6 @@ import re
 from typing import Iterable, List, Tuple
 
 import requests
-from galaxy.tool_util.deps.mulled.util import build_target, v2_image_name
 from packaging.version import InvalidVersion, Version
 
 log = logging.getLogger(__name__)
@@ -56,6 +55,9 @@ class MulledImageNameGenerator:
             build_number: The build number for this image. This is an incremental value that starts at zero.
 
         """
+        # Imported here as galaxy-tool-util is slow to import and only needed for this command
+        from galaxy.tool_util.deps.mulled.util import build_target, v2_image_name
+
         return v2_image_name([build_target(name, version) for name, version in targets], image_build=str(build_number))
 
     @classmethod
@@ -342,15 +342,17 @@ def setup_requests_cachedir():
     return config
 
 
-def wait_cli_function(poll_func, refresh_per_second=20):
+def wait_cli_function(poll_func, refresh_per_second=20, poll_interval=2, max_poll_interval=10):
     """
     Display a command-line spinner while calling a function repeatedly.
 
-    Keep waiting until that function returns True
+    Keep waiting until that function returns True, backing off between calls
 
     Arguments:
        poll_func (function): Function to call
        refresh_per_second (int): Refresh this many times per second. Default: 20.
+       poll_interval (int): Seconds to wait after the first call. Doubles after each call. Default: 2.
+       max_poll_interval (int): Maximum number of seconds to wait between calls. Default: 10.
 
     Returns:
        None. Just sits in an infite loop until the function returns True.
@@ -361,11 +363,16 @@ def wait_cli_function(poll_func, refresh_per_second=20):
             while True:
                 if poll_func():
                     break
-                time.sleep(2)
+                time.sleep(poll_interval)
+                poll_interval = min(poll_interval * 2, max_poll_interval)
     except KeyboardInterrupt:
         raise AssertionError("Cancelled!")
 
 
+# Reuse one connection to the nf-core website for repeated API polls
+nfcore_web_api = requests.Session()
+
+
 def poll_nfcore_web_api(api_url, post_data=None):
     """
     Poll the nf-core website API
@@ -378,9 +385,9 @@ def poll_nfcore_web_api(api_url, post_data=None):
     with requests_cache.disabled():
         try:
             if post_data is None:
-                response = requests.get(api_url, headers={"Cache-Control": "no-cache"})
+                response = nfcore_web_api.get(api_url, headers={"Cache-Control": "no-cache"})
             else:
-                response = requests.post(url=api_url, data=post_data)
+                response = nfcore_web_api.post(url=api_url, data=post_data)
         except requests.exceptions.Timeout:
             raise AssertionError(f"URL timed out: {api_url}")
         except requests.exceptions.ConnectionError:
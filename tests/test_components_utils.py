@@ -0,0 +1,28 @@
+"""Tests for the utility functions shared by modules and subworkflows."""
+
+from nf_core.components.components_utils import find_component_dirs
+
+
+def test_find_component_dirs_nested(tmp_path):
+    """Finds TOOL and TOOL/SUBTOOL directories, without searching inside of them"""
+    for component_dir in ("fastqc", "samtools/sort", "samtools/index", "fastqc/tests"):
+        (tmp_path / component_dir).mkdir(parents=True)
+        (tmp_path / component_dir / "main.nf").touch()
+    (tmp_path / "samtools" / "meta.yml").touch()
+    (tmp_path / "empty").mkdir()
+
+    assert sorted(find_component_dirs(tmp_path)) == ["fastqc", "samtools/index", "samtools/sort"]
+
+
+def test_find_component_dirs_missing_root(tmp_path):
+    """A directory that does not exist has no components"""
+    assert find_component_dirs(tmp_path / "missing") == []
+
+
+def test_find_component_dirs_root_is_component(tmp_path):
+    """The root directory itself is returned when it contains a main.nf file"""
+    (tmp_path / "main.nf").touch()
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "main.nf").touch()
+
+    assert find_component_dirs(tmp_path) == ["."]
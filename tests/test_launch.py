@@ -111,6 +111,20 @@ class TestLaunch(unittest.TestCase):
         self.launcher.merge_nxf_flag_schema()
         assert self.launcher.schema_obj.schema["allOf"][0] == {"$ref": "#/definitions/coreNextflow"}
         assert "-resume" in self.launcher.schema_obj.schema["definitions"]["coreNextflow"]["properties"]
+        # Merging again should not add a second reference
+        self.launcher.merge_nxf_flag_schema()
+        assert self.launcher.schema_obj.schema["allOf"].count({"$ref": "#/definitions/coreNextflow"}) == 1
+
+    def test_compile_schema(self):
+        """Check indexing the parameters from all schema definitions"""
+        self.launcher.get_pipeline_schema()
+        self.launcher.merge_nxf_flag_schema()
+        param_specs = self.launcher.compile_schema()
+        assert param_specs["-resume"]["filter"] is nf_core.launch._filter_boolean
+        assert param_specs["max_cpus"]["filter"] is nf_core.launch._filter_integer
+        assert param_specs["outdir"]["filter"] is None
+        # Cached until the schema changes
+        assert self.launcher.compile_schema() is param_specs
 
     def test_ob_to_questionary_string(self):
         """Check converting a python dict to a pyenquirer format - simple strings"""
@@ -228,6 +242,16 @@ class TestLaunch(unittest.TestCase):
         assert result["filter"]("false") == False
         assert result["filter"](False) == False
 
+    def test_ob_to_questionary_default_precedence(self):
+        """Check that earlier answers and input params take precedence over the schema default"""
+        sc_obj = {"type": "boolean", "default": False}
+        self.launcher.get_pipeline_schema()
+        assert self.launcher.single_param_to_questionary("foo", sc_obj, print_help=False)["default"] == "False"
+        self.launcher.schema_obj.input_params["foo"] = "true"
+        assert self.launcher.single_param_to_questionary("foo", sc_obj, print_help=False)["default"] == "True"
+        result = self.launcher.single_param_to_questionary("foo", sc_obj, answers={"foo": False}, print_help=False)
+        assert result["default"] == "False"
+
     def test_ob_to_questionary_number(self):
         """Check converting a python dict to a pyenquirer format - with enum"""
         sc_obj = {"type": "number", "default": 0.1}
@@ -314,6 +338,24 @@ class TestLaunch(unittest.TestCase):
         self.launcher.nxf_flags["-resume"] = True
         self.launcher.build_command()
         assert self.launcher.nextflow_cmd == f'nextflow run {self.template_dir} -name "Test_Workflow" -resume'
+        assert self.launcher.nextflow_argv == [
+            "nextflow",
+            "run",
+            self.template_dir,
+            "-name",
+            "Test_Workflow",
+            "-resume",
+        ]
+
+    @with_temporary_folder
+    def test_build_command_path_with_space(self, tmp_path):
+        """Test the functionality to build a nextflow command - pipeline path containing a space"""
+        pipeline_dir = os.path.join(tmp_path, "my pipeline")
+        os.symlink(self.template_dir, pipeline_dir)
+        self.launcher.pipeline = pipeline_dir
+        self.launcher.get_pipeline_schema()
+        self.launcher.build_command()
+        assert self.launcher.nextflow_argv == ["nextflow", "run", pipeline_dir]
 
     def test_build_command_params(self):
         """Test the functionality to build a nextflow command - params supplied"""
@@ -341,3 +383,4 @@ class TestLaunch(unittest.TestCase):
         self.launcher.schema_obj.input_params.update({"input": "custom_input"})
         self.launcher.build_command()
         assert self.launcher.nextflow_cmd == f'nextflow run {self.template_dir} --input "custom_input"'
+        assert self.launcher.nextflow_argv == ["nextflow", "run", self.template_dir, "--input", "custom_input"]
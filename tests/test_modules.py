@@ -5,11 +5,16 @@ import os
 import shutil
 import tempfile
 import unittest
+from unittest import mock
 
+import git
+import pytest
 import requests_mock
+import rich.progress
 
 import nf_core.create
 import nf_core.modules
+from nf_core.modules.modules_repo import ModulesRepo, RemoteProgressbar
 
 from .utils import (
     GITLAB_BRANCH_TEST_BRANCH,
@@ -44,6 +49,243 @@ def create_modules_repo_dummy(tmp_dir):
     return root_dir
 
 
+def create_modules_remote_dummy(tmp_dir):
+    """Create a local bare repository with a module, to use as a modules remote without network access"""
+    source_dir = os.path.join(tmp_dir, "source")
+    module_dir = os.path.join(source_dir, "modules", "nf-core", "fastqc")
+    os.makedirs(module_dir)
+    with open(os.path.join(source_dir, ".nf-core.yml"), "w") as fh:
+        fh.writelines(["repository_type: modules", "\n", "org_path: nf-core", "\n"])
+    with open(os.path.join(module_dir, "main.nf"), "w") as fh:
+        fh.write("process FASTQC {\n}\n")
+    with open(os.path.join(module_dir, "meta.yml"), "w") as fh:
+        fh.write("name: fastqc\n")
+
+    source_repo = git.Repo.init(source_dir)
+    source_repo.git.add(A=True)
+    source_repo.index.commit("Add fastqc")
+    source_repo.git.branch("-M", "master")
+    remote_dir = os.path.join(tmp_dir, "remote", "modules.git")
+    git.Repo.clone_from(source_dir, remote_dir, bare=True).close()
+    source_repo.create_remote("origin", remote_dir)
+    return f"file://{remote_dir}", source_repo
+
+
+class TestModulesRepo(unittest.TestCase):
+    """Class for ModulesRepo tests, using a local remote"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.remote_url, self.source_repo = create_modules_remote_dummy(self.tmp_dir)
+        # Don't let the state of other tests leak in, or out
+        for patcher in (
+            mock.patch.dict(ModulesRepo.local_repo_statuses),
+            mock.patch.dict(ModulesRepo.remote_heads_cache),
+            mock.patch.dict(ModulesRepo.local_repos),
+            mock.patch.object(ModulesRepo, "no_pull_global", False),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Clean up temporary files and folders"""
+        for local_repo in ModulesRepo.local_repos.values():
+            local_repo["repo"].close()
+        self.source_repo.close()
+        if os.path.exists(self.tmp_dir):
+            shutil.rmtree(self.tmp_dir)
+
+    def push_commit(self, message, branch="master"):
+        """Commit a change to the fastqc module and push it to the remote"""
+        with open(os.path.join(self.source_repo.working_dir, "modules", "nf-core", "fastqc", "main.nf"), "a") as fh:
+            fh.write(f"// {message}\n")
+        self.source_repo.git.add(A=True)
+        commit = self.source_repo.index.commit(message)
+        self.source_repo.remote("origin").push(f"HEAD:refs/heads/{branch}")
+        return commit.hexsha
+
+    def new_session(self):
+        """Forget what has been synced, as if the next ModulesRepo was created by a new nf-core command"""
+        for local_repo in ModulesRepo.local_repos.values():
+            local_repo["repo"].close()
+        ModulesRepo.local_repo_statuses.clear()
+        ModulesRepo.remote_heads_cache.clear()
+        ModulesRepo.local_repos.clear()
+
+    def test_modulesrepo_objects_keep_their_branch(self):
+        """ModulesRepo objects for the same remote share the local repository, but not their branch"""
+        self.source_repo.remote("origin").push("HEAD:refs/heads/dev")
+        modules_repo = ModulesRepo(self.remote_url, hide_progress=True)
+        modules_repo.setup_branch("dev")
+        other_modules_repo = ModulesRepo(self.remote_url, hide_progress=True)
+        dev_modules_repo = ModulesRepo(self.remote_url, branch="dev", hide_progress=True)
+
+        assert modules_repo.branch == "dev"
+        assert other_modules_repo.branch == "master"
+        assert dev_modules_repo.branch == "dev"
+        assert other_modules_repo is not modules_repo
+        assert other_modules_repo.repo is modules_repo.repo
+        assert dev_modules_repo.avail_components_cache is modules_repo.avail_components_cache
+
+    def create_legacy_cache(self):
+        """Create a full clone with a working tree at the local repository path, as older versions did"""
+        self.source_repo.remote("origin").push("HEAD:refs/heads/dev")
+        self.source_repo.remote("origin").push("HEAD:refs/heads/feature")
+        local_repo_dir = os.path.join(self.tmp_dir, "remote", "modules")
+        with git.Repo.clone_from(self.remote_url, local_repo_dir) as legacy_repo:
+            legacy_repo.git.checkout("feature")
+        return local_repo_dir
+
+    def test_legacy_cache_replaced_by_bare_clone(self):
+        """A full clone made by an older version is replaced by a bare clone"""
+        local_repo_dir = self.create_legacy_cache()
+        modules_repo = ModulesRepo(self.remote_url, hide_progress=True)
+
+        assert modules_repo.local_repo_dir == local_repo_dir
+        assert modules_repo.repo.bare
+        assert modules_repo.branch == "master"
+        assert {"master", "dev", "feature"} <= {head.name for head in modules_repo.repo.heads}
+        assert modules_repo.component_exists("fastqc", "modules")
+        # The temporary clone has been moved into place
+        assert sorted(os.listdir(os.path.dirname(local_repo_dir))) == ["modules", "modules.git"]
+
+    def test_legacy_cache_kept_without_pull(self):
+        """A full clone made by an older version is kept and used when pulling is disabled"""
+        local_repo_dir = self.create_legacy_cache()
+        modules_repo = ModulesRepo(self.remote_url, no_pull=True, hide_progress=True)
+
+        assert not modules_repo.repo.bare
+        assert os.path.isdir(os.path.join(local_repo_dir, ".git"))
+        # The default branch of the remote, not the one checked out last
+        assert modules_repo.branch == "master"
+        assert modules_repo.component_exists("fastqc", "modules")
+        # Branches that were never checked out are created from the remote branches
+        dev_modules_repo = ModulesRepo(self.remote_url, branch="dev", no_pull=True, hide_progress=True)
+        assert dev_modules_repo.branch == "dev"
+        assert dev_modules_repo.component_exists("fastqc", "modules")
+        with pytest.raises(LookupError):
+            ModulesRepo(self.remote_url, branch="missing", no_pull=True, hide_progress=True)
+
+    def test_remote_progressbar_without_total(self):
+        """Progress updates without a known total don't fail"""
+        progress_bar = rich.progress.Progress("{task.fields[state]}", disable=True)
+        remote_progress = RemoteProgressbar(progress_bar, "nf-core/modules", self.remote_url, "Cloning")
+        task = progress_bar.tasks[remote_progress.tid]
+        for max_count in (None, 0):
+            remote_progress.last_update = 0.0
+            remote_progress.update(git.RemoteProgress.COUNTING, 5, max_count)
+            assert task.started
+            assert task.fields["state"] == "Waiting for response"
+        remote_progress.last_update = 0.0
+        remote_progress.update(git.RemoteProgress.COUNTING, 5, 20)
+        assert task.fields["state"] == "25.0%"
+        assert task.completed == 5
+
+    def test_module_files_identical_by_blob_sha(self):
+        """Pipeline files are compared with the repository by their git blob SHA"""
+        modules_repo = ModulesRepo(self.remote_url, hide_progress=True)
+        commit = modules_repo.repo.commit(modules_repo.branch).hexsha
+        install_dir = os.path.join(self.tmp_dir, "pipeline_modules")
+        assert modules_repo.install_component("fastqc", install_dir, commit, "modules")
+        module_dir = os.path.join(install_dir, "fastqc")
+
+        local_shas = modules_repo.get_local_file_shas(module_dir)
+        assert local_shas["main.nf"] == git.Git().hash_object(os.path.join(module_dir, "main.nf"))
+        assert modules_repo.module_files_identical("fastqc", module_dir, commit) == {
+            "main.nf": True,
+            "meta.yml": True,
+        }
+
+        with open(os.path.join(module_dir, "main.nf"), "a") as fh:
+            fh.write("// local change\n")
+        assert modules_repo.module_files_identical("fastqc", module_dir, commit) == {
+            "main.nf": False,
+            "meta.yml": True,
+        }
+        # Precomputed SHAs are used instead of hashing the files again
+        assert modules_repo.module_files_identical("fastqc", module_dir, commit, local_shas) == {
+            "main.nf": True,
+            "meta.yml": True,
+        }
+
+    def test_module_files_identical_unknown_commit(self):
+        """Comparing with a commit that is not in the repository fails, instead of skipping the files"""
+        modules_repo = ModulesRepo(self.remote_url, hide_progress=True)
+        commit = modules_repo.repo.commit(modules_repo.branch).hexsha
+        install_dir = os.path.join(self.tmp_dir, "pipeline_modules")
+        assert modules_repo.install_component("fastqc", install_dir, commit, "modules")
+        module_dir = os.path.join(install_dir, "fastqc")
+        with open(os.path.join(module_dir, "main.nf"), "a") as fh:
+            fh.write("// local change\n")
+
+        for unknown_commit in ("0" * 40, "not-a-sha"):
+            with pytest.raises(LookupError):
+                modules_repo.module_files_identical("fastqc", module_dir, unknown_commit)
+
+    def test_sync_skipped_after_recent_fetch(self):
+        """A new command doesn't sync a local repository that was synced less than NFCORE_FETCH_TTL seconds ago"""
+        first_commit = ModulesRepo(self.remote_url, hide_progress=True).repo.commit("master").hexsha
+        self.push_commit("Update fastqc")
+
+        self.new_session()
+        modules_repo = ModulesRepo(self.remote_url, hide_progress=True)
+        assert modules_repo.repo.commit("master").hexsha == first_commit
+
+    def test_sync_after_fetch_ttl(self):
+        """A new command syncs the local repository once NFCORE_FETCH_TTL seconds have passed"""
+        ModulesRepo(self.remote_url, hide_progress=True)
+        new_commit = self.push_commit("Update fastqc")
+
+        self.new_session()
+        with mock.patch.dict(os.environ, {"NFCORE_FETCH_TTL": "0"}):
+            modules_repo = ModulesRepo(self.remote_url, hide_progress=True)
+        assert modules_repo.repo.commit("master").hexsha == new_commit
+
+    def test_sync_missing_branch_after_recent_fetch(self):
+        """A branch that is missing locally is fetched, even right after a sync"""
+        ModulesRepo(self.remote_url, hide_progress=True)
+        new_commit = self.push_commit("Update fastqc on a new branch", branch="new-branch")
+
+        self.new_session()
+        modules_repo = ModulesRepo(self.remote_url, branch="new-branch", hide_progress=True)
+        assert modules_repo.repo.commit("new-branch").hexsha == new_commit
+
+    def test_sync_missing_commit_after_recent_fetch(self):
+        """A commit that is missing locally is fetched before it is reported as missing, even right after a sync"""
+        ModulesRepo(self.remote_url, hide_progress=True)
+        new_commit = self.push_commit("Update fastqc")
+
+        self.new_session()
+        modules_repo = ModulesRepo(self.remote_url, hide_progress=True)
+        assert modules_repo.repo.commit("master").hexsha != new_commit
+        assert modules_repo.sha_exists_on_branch(new_commit)
+        assert not modules_repo.sha_exists_on_branch("0" * 40)
+
+    def test_commit_info_missing_commit_after_recent_fetch(self):
+        """Commit info is found for a commit that is missing locally, even right after a sync"""
+        ModulesRepo(self.remote_url, hide_progress=True)
+        new_commit = self.push_commit("Update fastqc")
+
+        self.new_session()
+        modules_repo = ModulesRepo(self.remote_url, hide_progress=True)
+        message, _ = modules_repo.get_commit_info(new_commit)
+        assert message == "Update fastqc"
+
+    def test_invalid_fetch_ttl(self):
+        """An invalid NFCORE_FETCH_TTL is reported, and the default is used instead"""
+        first_commit = ModulesRepo(self.remote_url, hide_progress=True).repo.commit("master").hexsha
+        self.push_commit("Update fastqc")
+
+        self.new_session()
+        # The warning is only logged the first time a value is parsed
+        nf_core.modules.modules_repo._parse_fetch_ttl.cache_clear()
+        with mock.patch.dict(os.environ, {"NFCORE_FETCH_TTL": "5m"}):
+            with self.assertLogs("nf_core.modules.modules_repo", level="WARNING") as logs:
+                modules_repo = ModulesRepo(self.remote_url, hide_progress=True)
+        assert "Invalid NFCORE_FETCH_TTL '5m'" in logs.output[0]
+        assert modules_repo.repo.commit("master").hexsha == first_commit
+
+
 class TestModules(unittest.TestCase):
     """Class for modules tests"""
 
@@ -2,7 +2,6 @@
 """
 
 import os
-import shlex
 import subprocess
 import tempfile
 import unittest
@@ -15,7 +14,8 @@ class TestRefgenie(unittest.TestCase):
         """
         Prepare a refgenie config file
         """
-        self.tmp_dir = tempfile.mkdtemp()
+        self.tmp_dir_obj = tempfile.TemporaryDirectory()
+        self.tmp_dir = self.tmp_dir_obj.name
         self.NXF_HOME = os.path.join(self.tmp_dir, ".nextflow")
         self.NXF_REFGENIE_PATH = os.path.join(self.NXF_HOME, "nf-core", "refgenie_genomes.config")
         self.REFGENIE = os.path.join(self.tmp_dir, "genomes_config.yaml")
@@ -31,7 +31,7 @@ class TestRefgenie(unittest.TestCase):
         os.makedirs(os.path.join(self.NXF_HOME, "nf-core"), exist_ok=True)
 
         # Initialize a refgenie config
-        os.system(f"refgenie init -c {self.REFGENIE}")
+        subprocess.run(["refgenie", "init", "-c", self.REFGENIE], check=True)
 
         # Add NXF_REFGENIE_PATH to refgenie config
         with open(self.REFGENIE, "a") as fh:
@@ -39,7 +39,7 @@ class TestRefgenie(unittest.TestCase):
 
     def tearDown(self) -> None:
         # Remove the tempdir again
-        os.system(f"rm -rf {self.tmp_dir}")
+        self.tmp_dir_obj.cleanup()
         # Reset NXF_HOME environment variable
         if self.NXF_HOME_ORIGINAL is None:
             del os.environ["NXF_HOME"]
@@ -49,7 +49,6 @@ class TestRefgenie(unittest.TestCase):
     def test_update_refgenie_genomes_config(self):
         """Test that listing pipelines works"""
         # Populate the config with a genome
-        cmd = f"refgenie pull t7/fasta -c {self.REFGENIE}"
-        out = subprocess.check_output(shlex.split(cmd), stderr=subprocess.STDOUT)
+        out = subprocess.check_output(["refgenie", "pull", "t7/fasta", "-c", self.REFGENIE], stderr=subprocess.STDOUT)
 
         assert "Updated nf-core genomes config" in str(out)
@@ -321,7 +321,7 @@ class TestSchema(unittest.TestCase):
 
         param = self.schema_obj.build_schema(test_pipeline_dir, True, False, None)
 
-    @mock.patch("requests.post")
+    @mock.patch("nf_core.utils.nfcore_web_api.post")
     def test_launch_web_builder_timeout(self, mock_post):
         """Mock launching the web builder, but timeout on the request"""
         # Define the behaviour of the request get mock
@@ -329,7 +329,7 @@ class TestSchema(unittest.TestCase):
         with pytest.raises(AssertionError):
             self.schema_obj.launch_web_builder()
 
-    @mock.patch("requests.post")
+    @mock.patch("nf_core.utils.nfcore_web_api.post")
     def test_launch_web_builder_connection_error(self, mock_post):
         """Mock launching the web builder, but get a connection error"""
         # Define the behaviour of the request get mock
@@ -337,7 +337,7 @@ class TestSchema(unittest.TestCase):
         with pytest.raises(AssertionError):
             self.schema_obj.launch_web_builder()
 
-    @mock.patch("requests.post")
+    @mock.patch("nf_core.utils.nfcore_web_api.post")
     def test_get_web_builder_response_timeout(self, mock_post):
         """Mock checking for a web builder response, but timeout on the request"""
         # Define the behaviour of the request get mock
@@ -345,7 +345,7 @@ class TestSchema(unittest.TestCase):
         with pytest.raises(AssertionError):
             self.schema_obj.launch_web_builder()
 
-    @mock.patch("requests.post")
+    @mock.patch("nf_core.utils.nfcore_web_api.post")
     def test_get_web_builder_response_connection_error(self, mock_post):
         """Mock checking for a web builder response, but get a connection error"""
         # Define the behaviour of the request get mock
@@ -372,7 +372,7 @@ class TestSchema(unittest.TestCase):
             response_data = {"status": "recieved", "api_url": "https://nf-co.re", "web_url": "https://nf-co.re"}
             return MockResponse(response_data, 200)
 
-    @mock.patch("requests.post", side_effect=mocked_requests_post)
+    @mock.patch("nf_core.utils.nfcore_web_api.post", side_effect=mocked_requests_post)
     def test_launch_web_builder_404(self, mock_post):
         """Mock launching the web builder"""
         self.schema_obj.web_schema_build_url = "invalid_url"
@@ -380,7 +380,7 @@ class TestSchema(unittest.TestCase):
             self.schema_obj.launch_web_builder()
         assert exc_info.value.args[0] == "Could not access remote API results: invalid_url (HTML 404 Error)"
 
-    @mock.patch("requests.post", side_effect=mocked_requests_post)
+    @mock.patch("nf_core.utils.nfcore_web_api.post", side_effect=mocked_requests_post)
     def test_launch_web_builder_invalid_status(self, mock_post):
         """Mock launching the web builder"""
         self.schema_obj.web_schema_build_url = "valid_url_error"
@@ -388,8 +388,8 @@ class TestSchema(unittest.TestCase):
             self.schema_obj.launch_web_builder()
         assert exc_info.value.args[0].startswith("Pipeline schema builder response not recognised")
 
-    @mock.patch("requests.post", side_effect=mocked_requests_post)
-    @mock.patch("requests.get")
+    @mock.patch("nf_core.utils.nfcore_web_api.post", side_effect=mocked_requests_post)
+    @mock.patch("nf_core.utils.nfcore_web_api.get")
     @mock.patch("webbrowser.open")
     def test_launch_web_builder_success(self, mock_post, mock_get, mock_webbrowser):
         """Mock launching the web builder"""
@@ -422,7 +422,7 @@ class TestSchema(unittest.TestCase):
             response_data = {"status": "web_builder_edited", "message": "testing saved", "schema": {"foo": "bar"}}
             return MockResponse(response_data, 200)
 
-    @mock.patch("requests.get", side_effect=mocked_requests_get)
+    @mock.patch("nf_core.utils.nfcore_web_api.get", side_effect=mocked_requests_get)
     def test_get_web_builder_response_404(self, mock_post):
         """Mock launching the web builder"""
         self.schema_obj.web_schema_build_api_url = "invalid_url"
@@ -430,7 +430,7 @@ class TestSchema(unittest.TestCase):
             self.schema_obj.get_web_builder_response()
         assert exc_info.value.args[0] == "Could not access remote API results: invalid_url (HTML 404 Error)"
 
-    @mock.patch("requests.get", side_effect=mocked_requests_get)
+    @mock.patch("nf_core.utils.nfcore_web_api.get", side_effect=mocked_requests_get)
     def test_get_web_builder_response_error(self, mock_post):
         """Mock launching the web builder"""
         self.schema_obj.web_schema_build_api_url = "valid_url_error"
@@ -438,13 +438,13 @@ class TestSchema(unittest.TestCase):
             self.schema_obj.get_web_builder_response()
         assert exc_info.value.args[0] == "Got error from schema builder: 'testing URL failure'"
 
-    @mock.patch("requests.get", side_effect=mocked_requests_get)
+    @mock.patch("nf_core.utils.nfcore_web_api.get", side_effect=mocked_requests_get)
     def test_get_web_builder_response_waiting(self, mock_post):
         """Mock launching the web builder"""
         self.schema_obj.web_schema_build_api_url = "valid_url_waiting"
         assert self.schema_obj.get_web_builder_response() is False
 
-    @mock.patch("requests.get", side_effect=mocked_requests_get)
+    @mock.patch("nf_core.utils.nfcore_web_api.get", side_effect=mocked_requests_get)
     def test_get_web_builder_response_saved(self, mock_post):
         """Mock launching the web builder"""
         self.schema_obj.web_schema_build_api_url = "valid_url_saved"
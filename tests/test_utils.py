@@ -207,3 +207,12 @@ def test_validate_file_md5():
         nf_core.utils.validate_file_md5(test_file, different_md5)
     with pytest.raises(ValueError):
         nf_core.utils.validate_file_md5(test_file, non_hex_string)
+
+
+@mock.patch("time.sleep")
+def test_wait_cli_function_backoff(mock_sleep):
+    """Check that the wait between polls doubles up to the maximum"""
+    poll_func = mock.Mock(side_effect=[False, False, False, False, True])
+    nf_core.utils.wait_cli_function(poll_func, poll_interval=2, max_poll_interval=10)
+    assert poll_func.call_count == 5
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [2, 4, 8, 10]